@@ -2,9 +2,60 @@
 Automatically generates ``cptools`` cli help docs.
 """
 
-import textwrap
+import functools
+import importlib.metadata
+import importlib.util
+import io
 from pathlib import Path
 
+PACKAGE_NAME = "codepost_powertools"
+FALLBACK_TEXT = "Sorry, could not generate CLI help text."
+SIGNATURE_PREFIX = ".. cli-sig: "
+CLI_DISTRIBUTIONS = ("click", "cloup")
+INDENT = " " * 3
+
+
+def indent(text):
+    """Prefixes each non-blank line of the text with ``INDENT``.
+
+    Like ``textwrap.indent(text, INDENT)``, but the lines are joined
+    with ``"\\n"``, so line endings are normalized and a trailing
+    newline is dropped.
+    """
+    return "\n".join(
+        f"{INDENT}{line}" if line.strip() else line
+        for line in text.splitlines()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def rule(char, length):
+    """Returns a section underline of the given character and length.
+
+    Titles of the same length share the same string.
+    """
+    return char * length
+
+
+def add_command_help(
+    help_file, name, help_str, *, paired_func=None, section_char="^"
+):
+    """Writes the help block of a command to the given buffer."""
+    title = f"``{name}`` command"
+    paired_func_line = ""
+    if paired_func is not None:
+        # add link to paired function
+        paired_func_line = f"See the paired function {paired_func}.\n\n"
+    help_file.write(
+        # add the header
+        f"{title}\n{rule(section_char, len(title))}\n\n"
+        f"{paired_func_line}"
+        # add the help str
+        ".. code-block:: text\n\n"
+        # prefix each line with 3 spaces
+        f"{indent(help_str)}\n\n"
+    )
+
 
 def generate_cli_docs():
     try:
@@ -15,46 +66,24 @@ def generate_cli_docs():
             get_help_str,
         )
     except ImportError:
-        return "Sorry, could not generate CLI help text."
-
-    help_file_lines = [
-        "*This page was automatically generated when building the docs.*",
-        "",
-    ]
-
-    def add_command_help(name, command, section_char="^"):
-        title = f"``{name}`` command"
-        help_str = get_help_str(name, command)
-        help_file_lines.extend(
-            [
-                # add the header
-                title,
-                section_char * len(title),
-                "",
-            ]
-        )
-        paired_func = getattr(command, "paired_func", None)
-        if paired_func is not None:
-            # add link to paired function
-            help_file_lines.extend(
-                [
-                    f"See the paired function {paired_func}.",
-                    "",
-                ]
-            )
-        help_file_lines.extend(
-            [
-                # add the help str
-                ".. code-block:: text",
-                "",
-                # prefix each line with 3 spaces
-                textwrap.indent(help_str, " " * 3),
-                "",
-            ]
-        )
+        return FALLBACK_TEXT
+
+    # each command contributes a single block, rather than a list of
+    # many small lines that all need to be joined at the end
+    help_file = io.StringIO()
+    help_file.write(
+        "*This page was automatically generated when building the docs.*\n\n"
+    )
+
+    cli_name = cli.name
 
     # add the top level command
-    add_command_help(cli.name, cli, section_char="-")
+    add_command_help(
+        help_file,
+        cli_name,
+        get_help_str(cli_name, cli),
+        section_char="-",
+    )
     # add all commands
     for section in get_all_sections(cli):
         commands = section.list_commands()
@@ -62,22 +91,63 @@ def generate_cli_docs():
             continue
         # add group header
         title = section.title
-        help_file_lines.extend(
-            [
-                title,
-                "-" * len(title),
-                "",
-            ]
-        )
+        help_file.write(f"{title}\n{rule('-', len(title))}\n\n")
         # add group commands
         for cmd_name, command in commands:
-            add_command_help(f"{cli.name} {cmd_name}", command)
+            name = f"{cli_name} {cmd_name}"
+            add_command_help(
+                help_file,
+                name,
+                get_help_str(name, command),
+                paired_func=getattr(command, "paired_func", None),
+            )
 
-    return "\n".join(help_file_lines)
+    # each block ends with a blank line, but the file should only end
+    # with a single newline
+    return help_file.getvalue().rstrip("\n") + "\n"
+
+
+def source_signature():
+    """Returns a signature of the package source files (the newest
+    modification time) and of the CLI libraries (their versions), or
+    None if the package could not be found.
+
+    The package is only located, not imported.
+    """
+    spec = importlib.util.find_spec(PACKAGE_NAME)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    package_dir = Path(next(iter(spec.submodule_search_locations)))
+    # also include this file, since it affects the output
+    paths = [Path(__file__), *package_dir.rglob("*.py")]
+    parts = [str(max(path.stat().st_mtime_ns for path in paths))]
+    # the help text is formatted by these libraries
+    for dist_name in CLI_DISTRIBUTIONS:
+        try:
+            version = importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+        parts.append(f"{dist_name}-{version}")
+    return " ".join(parts)
 
 
 def generate():
     CLI_HELP_DIR = Path("cli")
     CLI_HELP_DIR.mkdir(parents=True, exist_ok=True)
     help_file = CLI_HELP_DIR / "cptools-cli-help-generated.rst"
-    help_file.write_text(generate_cli_docs(), encoding="utf-8")
+
+    signature = source_signature()
+    signature_line = None
+    if signature is not None:
+        signature_line = f"{SIGNATURE_PREFIX}{signature}\n"
+        if help_file.exists():
+            with help_file.open(encoding="utf-8") as f:
+                if f.readline() == signature_line:
+                    # the source hasn't changed since the last generation
+                    return
+
+    help_text = generate_cli_docs()
+    if signature_line is not None and help_text != FALLBACK_TEXT:
+        # save the signature as a comment at the top of the file
+        help_text = f"{signature_line}\n{help_text}"
+    help_file.write_text(help_text, encoding="utf-8")
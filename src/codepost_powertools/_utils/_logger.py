@@ -7,10 +7,10 @@ Gets a logger to log messages or do nothing.
 from __future__ import annotations
 
 import sys
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import loguru
-from loguru import logger
+if TYPE_CHECKING:
+    import loguru
 
 # =============================================================================
 
@@ -18,11 +18,33 @@ __all__ = ("_get_logger",)
 
 # =============================================================================
 
-# Configure global logger
-# - Do not diagnose exceptions
-# - Set min level to 0 to show all logs
-logger.remove()
-logger.add(sys.stderr, diagnose=False, level=0)
+# The global logger, which is only imported and configured when a
+# functional logger is first requested
+_logger: Optional[loguru.Logger] = None
+
+
+def _configure_logger() -> loguru.Logger:
+    """Imports and configures the global logger.
+
+    Returns:
+        ``Logger``: The configured logger.
+
+    .. versionadded:: 0.2.0
+    """
+    global _logger  # pylint: disable=global-statement
+
+    # pylint: disable=import-outside-toplevel
+    from loguru import logger
+
+    # Configure global logger
+    # - Do not diagnose exceptions
+    # - Set min level to 0 to show all logs
+    logger.remove()
+    logger.add(sys.stderr, diagnose=False, level=0)
+
+    _logger = logger
+    return logger
+
 
 # =============================================================================
 
@@ -39,7 +61,10 @@ class NullLogger:
     def __call__(self, *args, **kwargs):
         return self
 
-    def __getattribute__(self, key):
+    def __getattr__(self, key):
+        # only called when normal lookup fails, so save the attribute on
+        # the instance to make subsequent lookups hit the instance dict
+        object.__setattr__(self, key, self)
         return self
 
 
@@ -60,5 +85,12 @@ def _get_logger(log: bool) -> Union[loguru.Logger, NullLogger]:
             Otherwise, a "null logger" that does nothing.
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       ``loguru`` is only imported when a functional logger is first
+       requested.
     """
-    return logger if log else _null_logger
+    if not log:
+        return _null_logger
+    if _logger is None:
+        return _configure_logger()
+    return _logger
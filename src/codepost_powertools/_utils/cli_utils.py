@@ -20,11 +20,6 @@ from codepost_powertools.config import log_in_codepost
 
 # =============================================================================
 
-# If running on command line, `log` is always True
-logger = _get_logger(log=True)
-
-# =============================================================================
-
 
 class SectionGroup(click.Group):
     """A ``click.Group`` that can be changed into a ``cloup.Section``.
@@ -82,10 +77,16 @@ def get_all_sections(
         return group.list_sections(ctx)
 
 
+@functools.lru_cache(maxsize=None)
 def get_help_str(command_title: str, command: click.Command) -> str:
     """Returns the help string of the given command.
 
+    The help string is cached for each command and title, so repeated
+    calls do not need to build a new context.
+
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       The help string is cached.
     """
     with cloup.Context(command, info_name=command_title) as ctx:
         return command.get_help(ctx)
@@ -97,6 +98,9 @@ def get_help_str(command_title: str, command: click.Command) -> str:
 class Stopwatch:
     """Keeps track of an amount of elapsed time.
 
+    Uses the monotonic :func:`time.perf_counter_ns` clock, so the
+    elapsed time is not affected by system clock adjustments.
+
     .. versionadded: 0.2.0
     """
 
@@ -108,7 +112,7 @@ class Stopwatch:
 
         .. versionadded: 0.2.0
         """
-        self._start = time.time()
+        self._start = time.perf_counter_ns()
         return self
 
     def elapsed(self) -> float:
@@ -122,7 +126,7 @@ class Stopwatch:
         """
         if self._start is None:
             return -1
-        return time.time() - self._start
+        return (time.perf_counter_ns() - self._start) / 1e9
 
     def elapsed_str(self) -> str:
         """Returns the time elapsed as a formatted string.
@@ -154,11 +158,15 @@ class Stopwatch:
 
         if elapsed < 60:
             return f"{elapsed:.2f} sec"
-        minutes, seconds = divmod(elapsed, 60)
-        if minutes < 60:
-            return f"{minutes:.0f} min, {seconds:.2f} sec"
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:.0f} hr, {minutes:.0f} min, {seconds:.2f} sec"
+        # split the whole seconds with integer math, then add the
+        # fractional part back to the seconds
+        whole_seconds = int(elapsed)
+        hours, rem = divmod(whole_seconds, 3600)
+        minutes, whole_secs = divmod(rem, 60)
+        seconds = whole_secs + (elapsed - whole_seconds)
+        if hours == 0:
+            return f"{minutes} min, {seconds:.2f} sec"
+        return f"{hours} hr, {minutes} min, {seconds:.2f} sec"
 
 
 # =============================================================================
@@ -174,9 +182,12 @@ def log_start_end(func):
     """
 
     @functools.wraps(func)
-    @click.pass_context
-    def log(ctx, **kwargs):
-        logger.trace("Start")
+    def log(**kwargs):
+        # If running on command line, `log` is always True
+        # The logger is only created when a command is run, not on import
+        _logger = _get_logger(log=True)
+
+        _logger.trace("Start")
         stopwatch = Stopwatch().start()
 
         had_error = False
@@ -189,17 +200,18 @@ def log_start_end(func):
         if not success:
             had_error = True
         else:
-            with logger.catch(
+            with _logger.catch(
                 reraise=False, onerror=onerror, message="Uncaught exception"
             ):
                 # unfortunately can't exit with nonzero status code if
                 # handled errors occur, since there's no way to know
                 # from this outer scope
                 # also pass `log=True`
-                ctx.invoke(func, **kwargs, log=True)
+                # `func` is the plain command callback, so it can be
+                # called directly instead of through `ctx.invoke()`
+                func(**kwargs, log=True)
 
-        logger.trace("Done")
-        logger.trace("Total time: {}", stopwatch.elapsed_str())
+        _logger.trace("Done in {}", stopwatch.elapsed_str())
 
         if had_error:
             sys.exit(1)
@@ -4,10 +4,10 @@ Utilities for reading and writing files.
 
 # =============================================================================
 
+import csv
+import os
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Optional
-
-import comma
+from typing import Any, Iterable, List, Mapping, Optional
 
 from codepost_powertools._utils import _get_logger, handle_error
 from codepost_powertools.utils.codepost_utils import course_str
@@ -27,6 +27,10 @@ DEFAULT_EXTS = (
     ".csv",
 )
 
+# The write buffer size for csv files, so that large files are written
+# with few system calls
+_CSV_BUFFER_SIZE = 1 << 20
+
 # =============================================================================
 
 
@@ -65,15 +69,18 @@ def get_path(
     """
     _logger = _get_logger(log)
 
-    result = Path(start_dir)
-    if result.exists() and not result.is_dir():
+    start_path = Path(start_dir)
+    if start_path.exists() and not start_path.is_dir():
         handle_error(log, NotADirectoryError, "Not a directory: {}", start_dir)
         return False, None
 
+    # collect the parts to build the final path only once
+    parts: List[PathLike] = []
+
     if course is not None:
-        result = result / course_str(course, delim="_")
+        parts.append(course_str(course, delim="_"))
         if assignment is not None:
-            result = result / assignment.name
+            parts.append(assignment.name)
     elif assignment is not None:
         _logger.warning(
             "Assignment ({!r}) will not be included: course was not given",
@@ -81,12 +88,12 @@ def get_path(
         )
 
     if folder is not None:
-        result = result / folder
+        parts.append(folder)
 
     if filename is not None:
-        result = result / filename
+        parts.append(filename)
 
-    return True, result
+    return True, start_path.joinpath(*parts)
 
 
 # =============================================================================
@@ -105,8 +112,9 @@ def validate_csv_silent(filepath: PathLike) -> SuccessOrErrorMsg:
 
     .. versionadded:: 0.1.0
     """
-    path = Path(filepath)
-    if path.suffix != ".csv":
+    # `os.path.splitext()` is cheaper than building a `Path` object
+    _, ext = os.path.splitext(os.fspath(filepath))
+    if ext != ".csv":
         return False, f"Not a csv file: {filepath}"
     return True, None
 
@@ -141,6 +149,10 @@ def save_csv(
 ) -> bool:
     """Saves data into a csv file.
 
+    The columns are taken from the keys of the first mapping, and the
+    rows are written as the data is iterated, so ``data`` may be a lazy
+    iterable. If ``data`` is empty, an empty file is created.
+
     Args:
         data (``Iterable[Mapping[str, Any]]``): The data.
             Each element in the iterable should be a mapping from the
@@ -155,6 +167,10 @@ def save_csv(
 
     Raises:
         ValueError: If ``filepath`` is not a csv file.
+
+    .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       The rows are streamed into the file with :class:`csv.DictWriter`.
     """
     _logger = _get_logger(log)
 
@@ -165,5 +181,21 @@ def save_csv(
     _logger.info("Saving {} to: {}", description, filepath)
 
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    comma.dump(data, filepath)
+
+    rows = iter(data)
+    first_row = next(rows, None)
+    with open(
+        filepath,
+        "w",
+        buffering=_CSV_BUFFER_SIZE,
+        newline="",
+        encoding="utf-8",
+    ) as f:
+        if first_row is not None:
+            writer = csv.DictWriter(
+                f, fieldnames=list(first_row.keys()), lineterminator="\n"
+            )
+            writer.writeheader()
+            writer.writerow(first_row)
+            writer.writerows(rows)
     return True
@@ -4,11 +4,12 @@ Utilities involving the ``gspread`` package.
 
 # =============================================================================
 
-from pathlib import Path
+from __future__ import annotations
 
-import google.auth.exceptions
-import gspread
-from google_auth_oauthlib.flow import InstalledAppFlow
+import stat
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
 
 from codepost_powertools._utils import _get_logger, handle_error
 from codepost_powertools.utils.gspread_wrappers import (
@@ -20,6 +21,11 @@ from codepost_powertools.utils.gspread_wrappers import (
 )
 from codepost_powertools.utils.types import PathLike, SuccessOrNone
 
+# The ``gspread`` and ``google`` packages are slow to import, so they are
+# only imported by the functions that need them
+if TYPE_CHECKING:
+    import gspread
+
 # =============================================================================
 
 __all__ = (
@@ -31,6 +37,7 @@ __all__ = (
     "Worksheet",
     "authenticate_client",
     "open_spreadsheet",
+    "invalidate_spreadsheet_cache",
 )
 
 # =============================================================================
@@ -44,6 +51,21 @@ AUTHORIZED_CLIENT_FILENAME = "client_authorized.json"
 # save a global client object that can be used in any function that
 # needs it.
 _GLOBAL_CLIENT = None
+# The credentials file that the global client was authenticated with
+_GLOBAL_CLIENT_CREDENTIALS = None
+
+# Opening a spreadsheet by name searches through the user's files, so
+# opened spreadsheets are cached for a short time. Maps each sheet name
+# to the time it was opened and the spreadsheet.
+_SPREADSHEET_CACHE: Dict[str, Tuple[float, Spreadsheet]] = {}
+# The number of seconds that an opened spreadsheet is cached for
+_SPREADSHEET_CACHE_TTL = 60.0
+
+# Requests that fail with these status codes (rate limits and server
+# errors) are retried with exponential backoff
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF_FACTOR = 0.3
 
 # =============================================================================
 
@@ -59,10 +81,43 @@ def _local_server_flow(client_config, scopes, port=0):
 
     .. versionadded:: 0.2.0
     """
+    # pylint: disable=import-outside-toplevel
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     flow = InstalledAppFlow.from_client_config(client_config, scopes)
     return flow.run_local_server(port=port, open_browser=False)
 
 
+def _retry_client_factory(auth) -> gspread.Client:
+    """Creates a |gspread Client| that retries requests that fail due
+    to rate limits or server errors.
+
+    The retries are done by the HTTP session, so they use exponential
+    backoff and respect the ``Retry-After`` header. Other errors, such
+    as forbidden access, are raised immediately.
+
+    .. versionadded:: 0.2.0
+    """
+    # pylint: disable=import-outside-toplevel
+    import gspread
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    client = gspread.Client(auth)
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        backoff_factor=_RETRY_BACKOFF_FACTOR,
+        status_forcelist=_RETRY_STATUS_CODES,
+        allowed_methods=frozenset(("GET", "PUT", "POST")),
+        respect_retry_after_header=True,
+        # return the last response so that `gspread` raises its usual
+        # `APIError` once the retries run out
+        raise_on_status=False,
+    )
+    client.session.mount("https://", HTTPAdapter(max_retries=retry))
+    return client
+
+
 def authenticate_client(
     *,
     credentials_file: PathLike = DEFAULT_CREDENTIALS_FILENAME,
@@ -74,9 +129,11 @@ def authenticate_client(
     If the client is already authenticated (in the cached
     ``client_authorized.json`` file), nothing will happen. However, if
     ``force_reauth`` is True, the user will be forcefully
-    re-authenticated.
+    re-authenticated. Repeated calls with the same credentials file
+    return the same client while it is still valid.
 
-    If the authorization has expired, it will be refreshed.
+    If the authorization has expired, it will be refreshed. The expiry
+    is checked locally, so no request is made for fresh credentials.
 
     Args:
         credentials_file (|PathLike|): A file containing the OAuth
@@ -93,14 +150,28 @@ def authenticate_client(
 
     .. versionadded:: 0.2.0
     """
-    global _GLOBAL_CLIENT  # pylint: disable=global-statement
+    # pylint: disable=global-statement
+    global _GLOBAL_CLIENT, _GLOBAL_CLIENT_CREDENTIALS
+
+    # pylint: disable=import-outside-toplevel
+    import google.auth.exceptions
+    import google.auth.transport.requests
+    import gspread
 
     _logger = _get_logger(log)
 
     _logger.info("Authenticating OAuth Client")
 
-    credentials_path = Path(credentials_file)
-    if not credentials_path.exists():
+    # avoid constructing a new `Path` if the caller passed one
+    credentials_path = (
+        credentials_file
+        if isinstance(credentials_file, Path)
+        else Path(credentials_file)
+    )
+    # use a single `stat()` call for both checks
+    try:
+        credentials_stat = credentials_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         handle_error(
             log,
             FileNotFoundError,
@@ -108,7 +179,7 @@ def authenticate_client(
             credentials_file,
         )
         return False, None
-    if not credentials_path.is_file():
+    if not stat.S_ISREG(credentials_stat.st_mode):
         handle_error(
             log,
             OSError,
@@ -117,31 +188,53 @@ def authenticate_client(
         )
         return False, None
 
+    # reuse the global client if it was authenticated with the same
+    # credentials and is still valid
+    credentials_path = credentials_path.resolve()
+    if (
+        not force_reauth
+        and _GLOBAL_CLIENT is not None
+        and _GLOBAL_CLIENT_CREDENTIALS == credentials_path
+        and not _GLOBAL_CLIENT.auth.expired
+    ):
+        _logger.debug("Reusing authenticated OAuth Client")
+        return True, _GLOBAL_CLIENT
+
     # put the file in the same directory
     auth_user_path = credentials_path.with_name(AUTHORIZED_CLIENT_FILENAME)
-    if force_reauth and auth_user_path.exists():
+    if force_reauth:
         # remove the cache for re-authentication
-        auth_user_path.unlink()
+        # `unlink(missing_ok=True)` requires Python 3.8
+        try:
+            auth_user_path.unlink()
+        except FileNotFoundError:
+            pass
 
     # by using the local server flow, the authentication cannot fail
     oauth_kwargs = {
         "credentials_filename": credentials_path,
         "authorized_user_filename": auth_user_path,
         "flow": _local_server_flow,
-        "client_factory": gspread.BackoffClient,
+        "client_factory": _retry_client_factory,
     }
     client = gspread.oauth(**oauth_kwargs)
 
-    # check if the client is expired
-    try:
-        client.list_spreadsheet_files()
-    except google.auth.exceptions.RefreshError:
-        _logger.warning("OAuth Client credentials expired; refreshing")
-        auth_user_path.unlink()
-        # try again
-        client = gspread.oauth(**oauth_kwargs)
+    # check the credentials' expiry locally instead of making a request
+    credentials = client.auth
+    if credentials.expired and credentials.refresh_token:
+        _logger.debug("OAuth Client credentials expired; refreshing")
+        try:
+            credentials.refresh(google.auth.transport.requests.Request())
+        except google.auth.exceptions.RefreshError:
+            _logger.warning("OAuth Client credentials revoked; reauthorizing")
+            auth_user_path.unlink()
+            # try again
+            client = gspread.oauth(**oauth_kwargs)
 
     _GLOBAL_CLIENT = client
+    _GLOBAL_CLIENT_CREDENTIALS = credentials_path
+    # the cached spreadsheets were opened with the previous client
+    invalidate_spreadsheet_cache()
     return True, client
 
 
@@ -156,6 +249,14 @@ def open_spreadsheet(
     If there are multiple spreadsheets with the same name, the first one
     found is returned.
 
+    Opened spreadsheets are cached for a short time, so opening the same
+    spreadsheet again does not search through the user's files and
+    returns the same object. Its worksheets are still fetched fresh by
+    :meth:`Spreadsheet.worksheets`, so editing the worksheets (such as
+    with :meth:`Spreadsheet.rebuild_worksheets`) does not make the cache
+    stale. However, callers that rename, move, or delete a spreadsheet
+    must call :func:`invalidate_spreadsheet_cache` afterwards.
+
     Args:
         sheet_name (|str|): The name of the sheet to open.
         log (|bool|): Whether to show log messages.
@@ -169,6 +270,17 @@ def open_spreadsheet(
 
     .. versionadded:: 0.2.0
     """
+    # pylint: disable=import-outside-toplevel
+    import gspread
+
+    cached = _SPREADSHEET_CACHE.get(sheet_name)
+    if cached is not None:
+        opened_time, spreadsheet = cached
+        if time.monotonic() - opened_time < _SPREADSHEET_CACHE_TTL:
+            _get_logger(log).info("Opening spreadsheet {!r}", sheet_name)
+            return True, spreadsheet
+        del _SPREADSHEET_CACHE[sheet_name]
+
     if _GLOBAL_CLIENT is None:
         success, _ = authenticate_client(log=log)
         if not success:
@@ -181,11 +293,14 @@ def open_spreadsheet(
     _logger.info("Opening spreadsheet {!r}", sheet_name)
 
     try:
-        return True, Spreadsheet.wrap(
+        spreadsheet = Spreadsheet.wrap(
             _GLOBAL_CLIENT.open(sheet_name)  # type: ignore[union-attr]
         )
     except gspread.SpreadsheetNotFound:
         pass
+    else:
+        _SPREADSHEET_CACHE[sheet_name] = (time.monotonic(), spreadsheet)
+        return True, spreadsheet
     handle_error(
         log,
         gspread.SpreadsheetNotFound,
@@ -193,3 +308,15 @@ def open_spreadsheet(
         sheet_name,
     )
     return False, None
+
+
+def invalidate_spreadsheet_cache():
+    """Clears the cache of spreadsheets opened by
+    :func:`open_spreadsheet`.
+
+    This should be called if spreadsheets are renamed or deleted outside
+    of this package.
+
+    .. versionadded:: 0.2.0
+    """
+    _SPREADSHEET_CACHE.clear()
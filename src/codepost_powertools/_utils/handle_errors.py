@@ -10,12 +10,6 @@ from codepost_powertools._utils._logger import _get_logger
 
 # =============================================================================
 
-# If logging an error, always display it
-# Set depth to 1 so that the caller location is shown in the log
-_error_logger = _get_logger(log=True).opt(depth=1)
-
-# =============================================================================
-
 
 def handle_error(
     log: bool, exception: Type[BaseException], msg: str, *args, **kwargs
@@ -35,6 +29,8 @@ def handle_error(
     .. versionadded:: 0.1.0
     """
     if log:
-        _error_logger.error(msg, *args, **kwargs)
+        # If logging an error, always display it
+        # Set depth to 1 so that the caller location is shown in the log
+        _get_logger(log=True).opt(depth=1).error(msg, *args, **kwargs)
         return
     raise exception(msg.format(*args, **kwargs))
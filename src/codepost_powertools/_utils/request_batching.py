@@ -0,0 +1,174 @@
+"""
+Utilities for batching requests to the Google Sheets API.
+"""
+
+# =============================================================================
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# =============================================================================
+
+__all__ = (
+    "merge_requests",
+    "batch_requests",
+)
+
+# =============================================================================
+
+
+def _merge_spans(
+    prev: Dict, cur: Dict, start_key: str, end_key: str
+) -> Optional[Tuple[int, int]]:
+    """Returns the union of the spans of two ranges along one dimension
+    if both are bounded and they touch or overlap. Otherwise, returns
+    None.
+
+    .. versionadded:: 0.2.0
+    """
+    prev_start = prev.get(start_key)
+    prev_end = prev.get(end_key)
+    cur_start = cur.get(start_key)
+    cur_end = cur.get(end_key)
+    if (
+        prev_start is None
+        or prev_end is None
+        or cur_start is None
+        or cur_end is None
+    ):
+        # unbounded
+        return None
+    if cur_start > prev_end or prev_start > cur_end:
+        return None
+    return min(prev_start, cur_start), max(prev_end, cur_end)
+
+
+def _merge_dimension_request(prev: Dict, cur: Dict) -> Optional[Dict]:
+    """Merges two ``updateDimensionProperties`` requests, or returns
+    None if they cannot be merged.
+
+    .. versionadded:: 0.2.0
+    """
+    if not (
+        prev["properties"] == cur["properties"]
+        and prev["fields"] == cur["fields"]
+    ):
+        return None
+    prev_range = prev["range"]
+    cur_range = cur["range"]
+    if not (
+        prev_range["sheetId"] == cur_range["sheetId"]
+        and prev_range["dimension"] == cur_range["dimension"]
+    ):
+        return None
+    span = _merge_spans(prev_range, cur_range, "startIndex", "endIndex")
+    if span is None:
+        return None
+    start, end = span
+    return {
+        **prev,
+        "range": {**prev_range, "startIndex": start, "endIndex": end},
+    }
+
+
+def _merge_repeat_cell_request(prev: Dict, cur: Dict) -> Optional[Dict]:
+    """Merges two ``repeatCell`` requests, or returns None if they
+    cannot be merged.
+
+    The ranges can be merged if they cover the same columns and touching
+    rows, or the same rows and touching columns. Only format requests
+    are merged: relative references in formulas shift across the range
+    of a ``repeatCell`` request, so merging values could change them.
+
+    .. versionadded:: 0.2.0
+    """
+    if "userEnteredValue" in prev["cell"]:
+        return None
+    if not (prev["cell"] == cur["cell"] and prev["fields"] == cur["fields"]):
+        return None
+    prev_range = prev["range"]
+    cur_range = cur["range"]
+    if prev_range["sheetId"] != cur_range["sheetId"]:
+        return None
+    for same_dim, merge_dim in (("Column", "Row"), ("Row", "Column")):
+        if not (
+            prev_range.get(f"start{same_dim}Index")
+            == cur_range.get(f"start{same_dim}Index")
+            and prev_range.get(f"end{same_dim}Index")
+            == cur_range.get(f"end{same_dim}Index")
+        ):
+            continue
+        start_key = f"start{merge_dim}Index"
+        end_key = f"end{merge_dim}Index"
+        span = _merge_spans(prev_range, cur_range, start_key, end_key)
+        if span is None:
+            continue
+        start, end = span
+        return {
+            **prev,
+            "range": {**prev_range, start_key: start, end_key: end},
+        }
+    return None
+
+
+_REQUEST_MERGERS = {
+    "updateDimensionProperties": _merge_dimension_request,
+    "repeatCell": _merge_repeat_cell_request,
+}
+
+
+def merge_requests(requests: List[Dict]) -> List[Dict]:
+    """Merges runs of consecutive requests that apply the same
+    properties to touching ranges.
+
+    Only consecutive requests are merged, so the order in which the
+    requests take effect is unchanged. The given requests are not
+    mutated.
+
+    Args:
+        requests (``List`` [``Dict``]): The requests.
+
+    Returns:
+        ``List`` [``Dict``]: The merged requests.
+
+    .. versionadded:: 0.2.0
+    """
+    merged: List[Dict] = []
+    prev_kind = None
+    for request in requests:
+        if len(request) == 1:
+            ((kind, body),) = request.items()
+        else:
+            kind = body = None
+        merger = _REQUEST_MERGERS.get(kind)
+        if merger is not None and kind == prev_kind:
+            merged_body = merger(merged[-1][kind], body)
+            if merged_body is not None:
+                merged[-1] = {kind: merged_body}
+                continue
+        merged.append(request)
+        prev_kind = kind
+    return merged
+
+
+def batch_requests(
+    requests: List[Dict], chunk_size: int
+) -> Iterator[List[Dict]]:
+    """Yields the given requests in chunks of at most ``chunk_size``
+    requests each, in order.
+
+    Consecutive requests that apply the same properties to touching
+    ranges are merged into a single request first, as in
+    :func:`merge_requests`.
+
+    Args:
+        requests (``List`` [``Dict``]): The requests.
+        chunk_size (|int|): The maximum number of requests per chunk.
+
+    Returns:
+        ``Iterator`` [``List`` [``Dict``]]: The chunks of requests.
+
+    .. versionadded:: 0.2.0
+    """
+    requests = merge_requests(requests)
+    for start in range(0, len(requests), chunk_size):
+        yield requests[start : start + chunk_size]
@@ -4,7 +4,9 @@ Handle package config.
 
 # =============================================================================
 
-from pathlib import Path
+import os
+import stat
+from typing import Dict, Tuple
 
 import codepost
 
@@ -26,6 +28,11 @@ codepost.set_app_info(name=package_name, url=docs_url, version=__version__)
 DEFAULT_CONFIG_FILE = "config.yaml"
 API_KEY = "api_key"
 
+# Maps a config file (its absolute path, modification time, and size)
+# to its validated api key, so that unchanged config files are not read
+# again
+_VALIDATED_API_KEYS: Dict[Tuple[str, int, int], str] = {}
+
 
 def log_in_codepost(
     config_file: PathLike = DEFAULT_CONFIG_FILE, *, log: bool = False
@@ -40,6 +47,9 @@ def log_in_codepost(
     your script. If you are using the command line, this method is
     called before each command.
 
+    A successful login is cached, so logging in again with the same
+    unchanged config file does not read and parse the file again.
+
     Args:
         config_file (|PathLike|): The config file to read.
         log (|bool|): Whether to show log messages.
@@ -56,15 +66,30 @@ def log_in_codepost(
         ValueError: If the given api key is invalid.
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       Successful logins are cached by the config file's path,
+       modification time, and size.
     """
 
-    config_file_path = Path(config_file)
-    if not config_file_path.exists() or not config_file_path.is_file():
+    try:
+        config_stat = os.stat(config_file)
+    except (FileNotFoundError, NotADirectoryError):
+        config_stat = None
+    if config_stat is None or not stat.S_ISREG(config_stat.st_mode):
         handle_error(
             log, FileNotFoundError, "Config file not found: {}", config_file
         )
         return False
 
+    cache_key = (
+        os.path.abspath(config_file),
+        config_stat.st_mtime_ns,
+        config_stat.st_size,
+    )
+    if cache_key in _VALIDATED_API_KEYS:
+        codepost.configure_api_key(_VALIDATED_API_KEYS[cache_key])
+        return True
+
     config = codepost.read_config_file([config_file])
     if config is None:
         # probably invalid format
@@ -102,4 +127,5 @@ def log_in_codepost(
         return False
 
     codepost.configure_api_key(cp_api_key)
+    _VALIDATED_API_KEYS[cache_key] = cp_api_key
     return True
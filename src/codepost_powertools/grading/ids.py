@@ -7,7 +7,8 @@ of the "--file" option.
 
 # =============================================================================
 
-from typing import Dict, Optional, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import click
 
@@ -111,26 +112,10 @@ def get_ids_mapping(
             )
         else:
             # populate the mapping with all the student emails
-            for student in roster.students:
-                ids[student] = None
-
-    _logger.info("Getting assignment submissions")
-
-    csv_data = []
-
-    for submission in assignment.list_submissions():
-        s_id = submission.id
-        for student in submission.students:
-            # students can only be associated with one submission, so
-            # this will never overwrite another submission id
-            ids[student] = s_id
-            csv_data.append(
-                {
-                    "submission_id": s_id,
-                    "email": student,
-                }
-            )
+            ids = dict.fromkeys(roster.students)
 
+    # find the file to save to first, so that the csv rows are only
+    # collected if they will actually be saved
     save_data_path: Optional[PathLike] = None
     if save_file is False:
         pass
@@ -143,6 +128,7 @@ def get_ids_mapping(
         else:
             save_data_path = save_file
 
+    save_filepath: Optional[Path] = None
     if save_data_path is not None:
         success, filepath = get_path(
             filename=save_data_path,
@@ -151,7 +137,31 @@ def get_ids_mapping(
             log=log,
         )
         if success:
-            save_csv(csv_data, filepath, description="ids", log=log)
+            save_filepath = filepath
+
+    _logger.info("Getting assignment submissions")
+
+    # the (submission id, email) rows of the csv file
+    csv_rows: Optional[List[Tuple[int, str]]] = (
+        None if save_filepath is None else []
+    )
+
+    for submission in assignment.list_submissions():
+        s_id = submission.id
+        for student in submission.students:
+            # students can only be associated with one submission, so
+            # this will never overwrite another submission id
+            ids[student] = s_id
+            if csv_rows is not None:
+                csv_rows.append((s_id, student))
+
+    if save_filepath is not None and csv_rows is not None:
+        # `save_csv()` streams the rows, so each dict is only built
+        # right before it is written
+        csv_data = (
+            {"submission_id": s_id, "email": email} for s_id, email in csv_rows
+        )
+        save_csv(csv_data, save_filepath, description="ids", log=log)
 
     return ids
 
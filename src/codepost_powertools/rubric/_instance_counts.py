@@ -0,0 +1,206 @@
+"""
+Counts the instances of rubric comments.
+"""
+
+# =============================================================================
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Counter, Dict, Iterable, List, Tuple
+
+from codepost_powertools._utils import _get_logger
+from codepost_powertools._utils.cli_utils import Stopwatch
+from codepost_powertools.utils.cptypes import Assignment
+
+# =============================================================================
+
+__all__ = (
+    "InstanceCounts",
+    "count_comment_instances",
+)
+
+# =============================================================================
+
+
+# an instance is created for every rubric comment, so use slots instead
+# of an instance dict where dataclasses support it (Python 3.10+)
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
+class InstanceCounts:
+    """Keeps track of the number of instances of a rubric comment.
+
+    .. versionadded:: 0.2.0
+    """
+
+    comment_id: int
+    """The id of the comment these counts are for."""
+    total: int = 0
+    """The total instances."""
+    upvotes: int = 0
+    """The number of upvotes this comment got."""
+    downvotes: int = 0
+    """The number of downvotes this comment got."""
+
+    @property
+    def upvote_percent(self) -> float:
+        """The percentage of upvotes this comment got.
+
+        .. versionadded:: 0.2.0
+        """
+        if self.total == 0:
+            return 0
+        return self.upvotes / self.total
+
+    @property
+    def downvote_percent(self) -> float:
+        """The percentage of downvotes this comment got.
+
+        .. versionadded:: 0.2.0
+        """
+        if self.total == 0:
+            return 0
+        return self.downvotes / self.total
+
+    def as_data_row(self) -> List[float]:
+        """Converts the instance counts into a data row.
+
+        The order is: total, upvotes, percent upvotes, downvotes,
+        percent downvotes.
+
+        If the total is 0, only the total will be given.
+
+        Returns:
+            ``List[float]``: The data.
+
+        .. versionadded:: 0.2.0
+        """
+        total = self.total
+        if total == 0:
+            return [0]
+        # the total is known to be nonzero, so divide directly instead
+        # of checking it again in the percent properties
+        upvotes = self.upvotes
+        downvotes = self.downvotes
+        return [
+            total,
+            upvotes,
+            upvotes / total,
+            downvotes,
+            downvotes / total,
+        ]
+
+
+#: The maximum number of submissions to fetch concurrently when counting
+#: comment instances.
+MAX_SUBMISSION_WORKERS = 8
+
+
+def _get_rubric_comment_feedback(submission) -> List[Tuple[int, int]]:
+    """Gets the rubric comment id and feedback of every rubric comment
+    applied to the given submission.
+
+    codePost fetches the files and comments of a submission lazily, so
+    this function makes network requests.
+
+    Args:
+        submission (``Submission``): The submission.
+
+    Returns:
+        ``List[Tuple[int, int]]``:
+            The rubric comment ids and feedback values.
+
+    .. versionadded:: 0.2.0
+    """
+    return [
+        (comment.rubricComment, comment.feedback)
+        for file in submission.files
+        for comment in file.comments
+        # skip comments that are not rubric comments
+        if comment.rubricComment is not None
+    ]
+
+
+def count_comment_instances(
+    assignment: Assignment, comment_ids: Iterable[int], *, log: bool = False
+) -> Dict[int, InstanceCounts]:
+    """Counts the number of instances of each rubric comment for the
+    given assignment.
+
+    If getting the comments of a submission fails, the error is logged
+    and that submission is skipped if ``log`` is True. Otherwise, the
+    error is raised.
+
+    Args:
+        assignment (|Assignment|_): The assignment.
+        comment_ids (``Iterable[int]``): The rubric comment ids.
+        log (|bool|): Whether to show log messages.
+
+    Returns:
+        ``Dict`` [|int|, :class:`InstanceCounts`]:
+            A mapping from rubric comment ids to ``InstanceCounts``
+            objects.
+
+    .. versionadded:: 0.2.0
+    """
+    _logger = _get_logger(log)
+
+    a_name = assignment.name
+
+    _logger.debug("Counting comment instances for assignment {!r}", a_name)
+
+    counts = {
+        comment_id: InstanceCounts(comment_id) for comment_id in comment_ids
+    }
+
+    stopwatch = Stopwatch().start()
+
+    submissions = assignment.list_submissions()
+
+    # maps: (comment id, feedback) -> number of instances
+    tally: Counter[Tuple[int, int]] = Counter()
+
+    # fetching the comments of each submission is bound by network
+    # latency, so fetch them concurrently and count them in this thread
+    with ThreadPoolExecutor(max_workers=MAX_SUBMISSION_WORKERS) as executor:
+        futures = [
+            (
+                submission,
+                executor.submit(_get_rubric_comment_feedback, submission),
+            )
+            for submission in submissions
+        ]
+        for submission, future in futures:
+            try:
+                tally.update(future.result())
+            except Exception as ex:  # pylint: disable=broad-except
+                if not log:
+                    raise
+                # the other submissions can still be counted
+                _logger.error(
+                    "Failed to get the comments of submission {}: {}",
+                    submission.id,
+                    ex,
+                )
+
+    for (comment_id, feedback), num_instances in tally.items():
+        instance_counts = counts[comment_id]
+        instance_counts.total += num_instances
+
+        # feedback votes
+        if not feedback:
+            # no feedback is the most common case
+            continue
+        if feedback == 1:
+            instance_counts.upvotes += num_instances
+        elif feedback == -1:
+            instance_counts.downvotes += num_instances
+
+    _logger.debug(
+        "Counted all comment instances for assignment {!r}: {}",
+        a_name,
+        stopwatch.elapsed_str(),
+    )
+
+    return counts
@@ -9,12 +9,37 @@ Exports a codePost rubric to a Google Sheet.
 # To edit the information displayed on the sheet, see:
 # - :func:`_format_is_template`
 # - :func:`_get_codepost_rubric_as_data_rows`
-# - :meth:`InstanceCounts.as_data_row`
+# - :meth:`_instance_counts.InstanceCounts.as_data_row`
+
+# Performance notes: exporting is bound by network requests, not by
+# computation, so changes should keep the number of requests down.
+# - :func:`_instance_counts.count_comment_instances` is bound by
+#   codePost latency, since every file of every submission is fetched
+#   separately. The fetches are done concurrently.
+# - :func:`_get_worksheets` and :func:`export_rubric` are bound by the
+#   Sheets API quota. The worksheets are rebuilt with one batch update,
+#   all the values are set with one values batch update, and all the
+#   formatting is sent with one batch update.
+# - Everything else (the headers, the rubric data rows, and the
+#   instance counts) is only interpreter work that is done once per
+#   export or once per rubric comment.
 
 # =============================================================================
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import click
 import cloup
@@ -26,14 +51,14 @@ from codepost_powertools._utils.cli_utils import (
     convert_course,
     log_start_end,
 )
-from codepost_powertools._utils.gspread_utils import (
-    Spreadsheet,
-    Worksheet,
-    col_index_to_letter,
-    open_spreadsheet,
-)
 from codepost_powertools.rubric._cli_group import group
-from codepost_powertools.utils.codepost_utils import TIER_PATTERN, with_course
+from codepost_powertools.rubric._instance_counts import count_comment_instances
+from codepost_powertools.utils.codepost_utils import (
+    TIER_FORMAT,
+    TIER_PATTERN,
+    get_assignments_by_name,
+    with_course,
+)
 from codepost_powertools.utils.cptypes import Assignment, Course
 from codepost_powertools.utils.sheets_api import (
     Color,
@@ -43,6 +68,11 @@ from codepost_powertools.utils.sheets_api import (
     WrapStrategy,
 )
 
+# ``gspread`` is slow to import, so the ``gspread_utils`` module is only
+# imported when a rubric is actually exported
+if TYPE_CHECKING:
+    from codepost_powertools._utils.gspread_utils import Spreadsheet, Worksheet
+
 # =============================================================================
 
 __all__ = ("export_rubric",)
@@ -64,8 +94,7 @@ class Headers:
     .. versionadded:: 0.2.0
     """
 
-    @dataclass(frozen=True, kw_only=True)
-    class Header:
+    class Header(NamedTuple):
         """Represents a header.
 
         .. versionadded:: 0.2.0
@@ -104,30 +133,40 @@ class Headers:
 
         .. versionadded:: 0.2.0
         """
+        # pylint: disable=import-outside-toplevel
+        from codepost_powertools._utils.gspread_utils import (
+            col_index_to_letter,
+        )
+
         self._include_instances = include_instances
         # maps: header -> index
         self._indices: Dict[str, int] = {}
-        # maps: header -> offset -> col letter
-        self._letters: Dict[str, Dict[int, str]] = {}
         self._names: List[str] = []
-        self._col_widths: List[Tuple[str, int]] = []
-        self._last_col_letter: Optional[str] = None
+        widths: List[Optional[int]] = []
 
         def add_headers(headers):
             for name, header in headers.items():
-                i = len(self._indices) + 1
-                self._indices[name] = i
-                col_letter = col_index_to_letter(i)
-                self._last_col_letter = col_letter
-                self._letters[name] = {0: col_letter}
+                self._indices[name] = len(self._indices) + 1
                 self._names.append(header.name)
-                if header.width is not None:
-                    self._col_widths.append((col_letter, header.width))
+                widths.append(header.width)
 
         add_headers(self._headers)
         if include_instances:
             add_headers(self._instance_headers)
 
+        num_cols = len(self._indices)
+        # the column letters by index (0-indexed), including one extra
+        # column after the last header for offsets
+        self._col_letters: Tuple[str, ...] = tuple(
+            col_index_to_letter(i) for i in range(1, num_cols + 2)
+        )
+        self._last_col_letter: str = self._col_letters[num_cols - 1]
+        self._col_widths: List[Tuple[str, int]] = [
+            (self._col_letters[i], width)
+            for i, width in enumerate(widths)
+            if width is not None
+        ]
+
     @property
     def include_instances(self) -> bool:
         """Whether to include the "instances" columns.
@@ -196,12 +235,16 @@ class Headers:
 
         .. versionadded:: 0.2.0
         """
-        if offset not in self._letters[header]:
-            # cache the letter with offset
-            self._letters[header][offset] = col_index_to_letter(
-                self._indices[header] + offset
+        index = self._indices[header] + offset
+        if 0 < index <= len(self._col_letters):
+            col_letter = self._col_letters[index - 1]
+        else:
+            # pylint: disable=import-outside-toplevel
+            from codepost_powertools._utils.gspread_utils import (
+                col_index_to_letter,
             )
-        col_letter = self._letters[header][offset]
+
+            col_letter = col_index_to_letter(index)
         return f"{col_letter}{row}"
 
     def col_range(
@@ -389,13 +432,16 @@ def _get_worksheets(
 
     .. versionadded:: 0.2.0
     """
+    # pylint: disable=import-outside-toplevel
+    from codepost_powertools._utils.gspread_utils import Worksheet
+
     _logger = _get_logger(log)
 
     existing = sheet.worksheets()
-    # add a temporary worksheet so we don't have to deal with edge case
-    # of removing all the sheets (which is an error)
-    temp = sheet.add_worksheet(title="__temp")
 
+    # all the worksheets are deleted, replaced, and added with a single
+    # request after the assignments are matched to worksheets
+    to_delete = []
     existing_assignment_worksheets = {}
 
     if wipe:
@@ -404,52 +450,59 @@ def _get_worksheets(
         _logger.debug(
             "Wiping {}", with_pluralized(num_existing, "existing worksheet")
         )
-        for _ in range(num_existing):
-            sheet.del_worksheet(existing.pop())
+        to_delete = existing
     elif replace:
         # get worksheets for each assignment
-        for index, worksheet in enumerate(existing):
-            # assume the first cell contains the assignment id
-            a1 = Worksheet(worksheet).get_cell("A1").value
+        # assume the first cell contains the assignment id
+        first_cells = sheet.get_cell_values(existing, "A1")
+        for index, (worksheet, a1) in enumerate(zip(existing, first_cells)):
             if a1 is not None and a1.isdigit():
                 existing_assignment_worksheets[int(a1)] = (worksheet, index)
 
     _logger.info("Getting worksheets for each assignment")
-    found = 0
-    created = 0
 
-    worksheets = {}
+    assignment_names = []
+    to_replace = []
+    replaced_names = []
+    created_names = []
 
     for assignment in assignments:
         a_id = assignment.id
         a_name = assignment.name
-
-        this_worksheet = None
+        assignment_names.append(a_name)
 
         if replace and a_id in existing_assignment_worksheets:
             _logger.debug("Replacing worksheet for assignment {!r}", a_name)
-            found += 1
             # TODO: actually replace existing worksheet rather than
             #   deleting and adding new worksheet in its place
-            worksheet, index = existing_assignment_worksheets.pop(a_id)
-            title = worksheet.title
-            sheet.del_worksheet(worksheet)
-            # add new worksheet in same place
-            this_worksheet = Worksheet(
-                sheet.add_worksheet(title=title, index=index)
-            )
+            to_replace.append(existing_assignment_worksheets.pop(a_id))
+            replaced_names.append(a_name)
         else:
-            created += 1
-            # create new worksheet
-            this_worksheet = Worksheet(sheet.add_worksheet(title=a_name))
+            created_names.append(a_name)
 
-        # format the sheet with default font
-        this_worksheet.format_cell("A1", font_family="Fira Code", update=True)
+    found = len(replaced_names)
+    created = len(created_names)
 
-        worksheets[a_name] = this_worksheet
+    # add new worksheets in the same places as the replaced ones, and
+    # create new worksheets at the end
+    replacements, additions = sheet.rebuild_worksheets(
+        existing, delete=to_delete, replace=to_replace, add=created_names
+    )
+    new_worksheets = dict(
+        zip(
+            replaced_names + created_names,
+            map(Worksheet, replacements + additions),
+        )
+    )
+    # keep the order of the assignments
+    worksheets = {
+        a_name: new_worksheets[a_name] for a_name in assignment_names
+    }
 
-    # remove temp worksheet
-    sheet.del_worksheet(temp)
+    for this_worksheet in worksheets.values():
+        # format the sheet with default font
+        # this request is sent with the rest of the worksheet formatting
+        this_worksheet.format_cell("A1", font_family="Fira Code")
 
     if log:
         actions_to_log = []
@@ -488,6 +541,36 @@ def _format_is_template(is_template: bool) -> str:
     return "Yes" if is_template else ""
 
 
+# the literal text that every tiered comment starts with
+_TIER_PREFIX = TIER_FORMAT[: TIER_FORMAT.index("{")]
+
+
+def _split_tier(text: str) -> Tuple[Union[Literal[""], int], str]:
+    """Splits the tier off of the given rubric comment text.
+
+    Args:
+        text (|str|): The rubric comment text.
+
+    Returns:
+        ``Tuple[Literal[""] | int, str]``:
+            The tier (or the empty string if the text has no tier) and
+            the rest of the text.
+
+    .. versionadded:: 0.2.0
+    """
+    # most comments don't have a tier, so check the prefix before
+    # running the regex
+    if not text.startswith(_TIER_PREFIX):
+        return "", text
+    match = TIER_PATTERN.match(text)
+    if match is None:
+        return "", text
+    tier_digits, text = match.group("tier", "text")
+    # unnecessary, since the values don't care about type and it's
+    # guaranteed to be a string of digits already
+    return int(tier_digits), text
+
+
 def _get_codepost_rubric_as_data_rows(
     assignment: Assignment, *, log: bool = False
 ) -> Dict[int, List[List[Any]]]:
@@ -513,9 +596,15 @@ def _get_codepost_rubric_as_data_rows(
 
     _logger.debug("Getting codePost rubric for assignment {!r}", a_name)
 
+    # bind the per-comment helpers to locals once, since they are looked
+    # up for every comment
+    split_tier = _split_tier
+    format_is_template = _format_is_template
+
     rubric_data = {}
 
     for category in assignment.rubricCategories:
+        category_name = category.name
         category_points = category.pointLimit
         if category_points is None:
             category_points = ""
@@ -524,34 +613,19 @@ def _get_codepost_rubric_as_data_rows(
             category_points *= -1
 
         for comment in category.rubricComments:
-            comment_id = comment.id
-
-            # flip the value
-            comment_points = -1 * comment.pointDelta
-            text = comment.text
-
-            # get tier if has it
-            match = TIER_PATTERN.match(text)
-            tier: Union[Literal[""], int]
-            if match is None:
-                tier = ""
-            else:
-                tier_digits, text = match.group("tier", "text")
-                # unnecessary, since the values don't care about type and it's
-                # guaranteed to be a string of digits already
-                tier = int(tier_digits)
-
-            rubric_data[comment_id] = [
-                comment_id,
-                category.name,
+            tier, text = split_tier(comment.text)
+            rubric_data[comment.id] = [
+                comment.id,
+                category_name,
                 category_points,
                 comment.name,
                 tier,
-                comment_points,
+                # flip the value
+                -1 * comment.pointDelta,
                 text,
                 comment.explanation,
                 comment.instructionText,
-                _format_is_template(comment.templateTextOn),
+                format_is_template(comment.templateTextOn),
             ]
 
     _logger.debug("Got all rubric comments for assignment {!r}", a_name)
@@ -562,126 +636,6 @@ def _get_codepost_rubric_as_data_rows(
 # =============================================================================
 
 
-@dataclass
-class InstanceCounts:
-    """Keeps track of the number of instances of a rubric comment.
-
-    .. versionadded:: 0.2.0
-    """
-
-    comment_id: int
-    """The id of the comment these counts are for."""
-    total: int = 0
-    """The total instances."""
-    upvotes: int = 0
-    """The number of upvotes this comment got."""
-    downvotes: int = 0
-    """The number of downvotes this comment got."""
-
-    @property
-    def upvote_percent(self) -> float:
-        """The percentage of upvotes this comment got.
-
-        .. versionadded:: 0.2.0
-        """
-        if self.total == 0:
-            return 0
-        return self.upvotes / self.total
-
-    @property
-    def downvote_percent(self) -> float:
-        """The percentage of downvotes this comment got.
-
-        .. versionadded:: 0.2.0
-        """
-        if self.total == 0:
-            return 0
-        return self.downvotes / self.total
-
-    def as_data_row(self) -> List[float]:
-        """Converts the instance counts into a data row.
-
-        The order is: total, upvotes, percent upvotes, downvotes,
-        percent downvotes.
-
-        If the total is 0, only the total will be given.
-
-        Returns:
-            ``List[float]``: The data.
-
-        .. versionadded:: 0.2.0
-        """
-        if self.total == 0:
-            return [0]
-        return [
-            self.total,
-            self.upvotes,
-            self.upvote_percent,
-            self.downvotes,
-            self.downvote_percent,
-        ]
-
-
-def _count_comment_instances(
-    assignment: Assignment, comment_ids: Iterable[int], *, log: bool = False
-):
-    """Counts the number of instances of each rubric comment for the
-    given assignment.
-
-    Args:
-        assignment (|Assignment|_): The assignment.
-        comment_ids (``Iterable[int]``): The rubric comment ids.
-        log (|bool|): Whether to show log messages.
-
-    Returns:
-        ``Dict`` [|int|, :class:`InstanceCounts`]:
-            A mapping from rubric comment ids to ``InstanceCounts``
-            objects.
-
-    .. versionadded:: 0.2.0
-    """
-    _logger = _get_logger(log)
-
-    a_name = assignment.name
-
-    _logger.debug("Counting comment instances for assignment {!r}", a_name)
-
-    counts = {
-        comment_id: InstanceCounts(comment_id) for comment_id in comment_ids
-    }
-
-    stopwatch = Stopwatch().start()
-
-    for submission in assignment.list_submissions():
-        for file in submission.files:
-            for comment in file.comments:
-                comment_id = comment.rubricComment
-                if comment_id is None:
-                    # not a rubric comment
-                    continue
-                counts[comment_id].total += 1
-
-                # feedback votes
-                feedback = comment.feedback
-                if feedback == 0:
-                    pass
-                elif feedback == 1:
-                    counts[comment_id].upvotes += 1
-                elif feedback == -1:
-                    counts[comment_id].downvotes += 1
-
-    _logger.debug(
-        "Counted all comment instances for assignment {!r}: {}",
-        a_name,
-        stopwatch.elapsed_str(),
-    )
-
-    return counts
-
-
-# =============================================================================
-
-
 @with_course
 def export_rubric(
     course: Course,
@@ -733,6 +687,9 @@ def export_rubric(
 
     .. versionadded:: 0.2.0
     """
+    # pylint: disable=import-outside-toplevel
+    from codepost_powertools._utils.gspread_utils import open_spreadsheet
+
     _logger = _get_logger(log)
     headers = Headers(count_instances)
 
@@ -749,9 +706,7 @@ def export_rubric(
         return successes
 
     _logger.debug("Getting assignments")
-    course_assignments = {
-        assignment.name: assignment for assignment in course.assignments
-    }
+    course_assignments = get_assignments_by_name(course)
     valid_assignments = {}
     for assignment_name in successes:
         if assignment_name not in course_assignments:
@@ -772,6 +727,8 @@ def export_rubric(
     success, spreadsheet = open_spreadsheet(sheet_name, log=log)
     if not success:
         return successes
+    # a successful open always returns the spreadsheet
+    assert spreadsheet is not None
 
     # get worksheets for each assignment
     worksheets = _get_worksheets(
@@ -784,33 +741,52 @@ def export_rubric(
 
     _logger.info("Exporting rubrics to spreadsheet")
 
+    # the names and formats only depend on the headers, so they are the
+    # same for every worksheet and can be built once
+    header_names = headers.names
+    format_kwargs = _assignment_worksheet_format_kwargs(headers)
+
     # maps: assignment name -> comment id -> comment data
     comment_ids = {}
+    # the values of all the worksheets are set with a single request
+    worksheet_values = []
     for assignment_name, assignment in valid_assignments.items():
         comments = _get_codepost_rubric_as_data_rows(assignment, log=log)
         comment_ids[assignment_name] = comments
 
+        # the rows are references to the existing comment rows, so this
+        # list does not copy any of the rubric data
         values = [
             [assignment.id, f"Assignment: {assignment_name}"],
-            headers.names,
+            header_names,
+            *comments.values(),
         ]
-        values.extend(comments.values())
 
         _logger.debug(
             "Displaying rubric comments for assignment {!r}", assignment_name
         )
         worksheet = worksheets[assignment_name]
-        worksheet.set_values(values)
-        worksheet.bulk_format(
-            **_assignment_worksheet_format_kwargs(headers), update=True
-        )
+        worksheet_values.append((worksheet, values, "A1"))
+        worksheet.bulk_format(**format_kwargs)
 
         successes[assignment_name] = True
 
+    spreadsheet.set_worksheets_values(worksheet_values)
+
+    # format all the worksheets with a single request
+    _logger.debug("Formatting worksheets")
+    spreadsheet.update_worksheets(worksheets.values())
+
     if count_instances:
         _logger.info("Counting instances of all rubric comments")
         stopwatch = Stopwatch().start()
 
+        instances_range = headers.col_letter(
+            "INSTANCES_TOTAL", row=HEADER_ROW + 1
+        )
+        # the instances of all the worksheets are set with a single request
+        worksheet_values = []
+
         for assignment_name, assignment in valid_assignments.items():
             if not successes[assignment_name]:
                 _logger.warning(
@@ -818,7 +794,7 @@ def export_rubric(
                 )
                 continue
 
-            counts = _count_comment_instances(
+            counts = count_comment_instances(
                 assignment, comment_ids[assignment_name].keys(), log=log
             )
             values = [
@@ -829,13 +805,12 @@ def export_rubric(
             _logger.debug(
                 "Displaying instances for assignment {!r}", assignment_name
             )
-            worksheets[assignment_name].set_values(
-                values,
-                range_a1=headers.col_letter(
-                    "INSTANCES_TOTAL", row=HEADER_ROW + 1
-                ),
+            worksheet_values.append(
+                (worksheets[assignment_name], values, instances_range)
             )
 
+        spreadsheet.set_worksheets_values(worksheet_values)
+
         _logger.info(
             "Counted instances of all rubric comments: {}",
             stopwatch.elapsed_str(),
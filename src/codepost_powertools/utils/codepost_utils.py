@@ -6,7 +6,7 @@ Utilities involving the codePost SDK.
 
 import functools
 import re
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import codepost
 
@@ -29,9 +29,15 @@ __all__ = (
     "TIER_FORMAT",
     "TIER_PATTERN",
     "get_course",
+    "invalidate_course_cache",
+    "prefetch_courses",
     "course_str",
     "get_course_roster",
+    "invalidate_roster_cache",
     "get_assignment",
+    "get_assignments_by_name",
+    "invalidate_assignment_cache",
+    "prefetch_assignments",
 )
 
 # =============================================================================
@@ -42,6 +48,20 @@ TIER_PATTERN = re.compile(r"\\\[T(?P<tier>\d+)\\] (?P<text>.*)")
 
 # =============================================================================
 
+# Cache of courses found by `get_course()`
+# maps: (name, period) -> course
+_COURSE_CACHE: Dict[Tuple[str, str], Course] = {}
+
+# Cache of rosters fetched by `get_course_roster()`
+# maps: course id -> roster
+_ROSTER_CACHE: Dict[int, Roster] = {}
+
+# Index of the assignments of each course used by `get_assignment()`
+# maps: course id -> assignment name -> assignment
+_ASSIGNMENT_INDEX: Dict[int, Dict[str, Assignment]] = {}
+
+# =============================================================================
+
 
 def with_course(func):
     """Decorates a function to fetch a course before calling.
@@ -58,18 +78,22 @@ def with_course(func):
     If the retrieval is unsuccessful, ``course`` will be passed as
     ``None``, which the function should handle itself.
 
+    The decorated function must accept a ``log`` keyword argument, which
+    is always passed to it.
+
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       ``log`` is always passed to the decorated function.
     """
 
     @functools.wraps(func)
-    def wrapped(course: CourseArg, *args, **kwargs):
-        log = kwargs.get("log", False)
+    def wrapped(course: CourseArg, *args, log: bool = False, **kwargs):
         if not isinstance_cp(course, Course):
             # `course` is a tuple of the course name and period
             name, period = course
             # if this call fails, `course` will be None, which is passed
             _, course = get_course(name, period, log=log)
-        return func(course, *args, **kwargs)
+        return func(course, *args, log=log, **kwargs)
 
     return wrapped
 
@@ -97,6 +121,9 @@ def with_course_and_assignment(func):
     will both be passed as ``None``, which the function should handle
     itself.
 
+    The decorated function must accept a ``log`` keyword argument, which
+    is always passed to it.
+
     .. note
        If |Course|_ and |Assignment|_ objects are given, the decorator
        will simply pass the arguments to the decorated function without
@@ -104,14 +131,18 @@ def with_course_and_assignment(func):
        the function to ensure.
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       ``log`` is always passed to the decorated function.
     """
 
-    @functools.wraps(func)
     @with_course
-    def wrapped(
-        course: Optional[Course], assignment: AssignmentArg, *args, **kwargs
+    def resolve(
+        course: Optional[Course],
+        assignment: AssignmentArg,
+        *args,
+        log: bool = False,
+        **kwargs,
     ):
-        log: bool = kwargs.get("log", False)
         if course is None:
             # course retrieval failed; cannot get assignment
             assignment = None
@@ -120,7 +151,22 @@ def with_course_and_assignment(func):
             if not success:
                 # also set `course` to None
                 course = None
-        return func(course, assignment, *args, **kwargs)
+        return func(course, assignment, *args, log=log, **kwargs)
+
+    @functools.wraps(func)
+    def wrapped(
+        course: CourseArg,
+        assignment: AssignmentArg,
+        *args,
+        log: bool = False,
+        **kwargs,
+    ):
+        if isinstance_cp(course, Course) and isinstance_cp(
+            assignment, Assignment
+        ):
+            # nothing to fetch, so skip the `with_course` wrapper
+            return func(course, assignment, *args, log=log, **kwargs)
+        return resolve(course, assignment, *args, log=log, **kwargs)
 
     return wrapped
 
@@ -129,16 +175,25 @@ def with_course_and_assignment(func):
 
 
 def get_course(
-    name: str, period: str, *, log: bool = False
+    name: str, period: str, *, check_duplicates: bool = True, log: bool = False
 ) -> SuccessOrNone[Course]:
     """Gets a codePost course.
 
     If there are multiple courses with the same name and period, the
-    first one found is returned.
+    first one found is returned, and a warning is logged if
+    ``check_duplicates`` is True. Checking for duplicates means that the
+    rest of the available courses are searched after the first match,
+    so it can be turned off to stop searching at the first match.
+
+    Found courses are cached, so getting the same course again does not
+    search through all the available courses. Use
+    :func:`invalidate_course_cache` to clear the cache.
 
     Args:
         name (|str|): The course name.
         period (|str|): The course period.
+        check_duplicates (|bool|): Whether to check for other courses
+            with the same name and period.
         log (|bool|): Whether to show log messages.
 
     Returns:
@@ -149,23 +204,31 @@ def get_course(
         ValueError: If no course is found.
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       Found courses are cached. Added the ``check_duplicates``
+       argument.
     """
     _logger = _get_logger(log)
 
     _logger.info("Getting course {!r} with period {!r}", name, period)
 
+    cached = _COURSE_CACHE.get((name, period))
+    if cached is not None:
+        return True, cached
+
     # specifying the name and period in `iter_available()` works, but it
     # ignores empty strings, so do this to handle all cases
-    found = []
-    for course in codepost.course.iter_available():
-        if course.name == name and course.period == period:
-            found.append(course)
-            if len(found) >= 2:
-                # already found two; don't need to check rest
-                break
-    if len(found) > 0:
-        course = found[0]
-        if len(found) > 1:
+    # `iter_available()` creates the course objects lazily, so stop as
+    # soon as the first match and a possible duplicate are found (when
+    # there is no duplicate, the rest of the courses are still searched)
+    found = (
+        course
+        for course in codepost.course.iter_available()
+        if course.name == name and course.period == period
+    )
+    course = next(found, None)
+    if course is not None:
+        if check_duplicates and next(found, None) is not None:
             _logger.warning(
                 "Multiple courses found with name {!r} and period {!r}: "
                 "returning course {}",
@@ -173,7 +236,8 @@ def get_course(
                 period,
                 course.id,
             )
-        return True, found[0]
+        _COURSE_CACHE[(name, period)] = course
+        return True, course
 
     handle_error(
         log,
@@ -185,6 +249,31 @@ def get_course(
     return False, None
 
 
+def invalidate_course_cache():
+    """Clears the cache of courses found by :func:`get_course`.
+
+    This should be called if courses are created, renamed, or deleted
+    outside of this package.
+
+    .. versionadded:: 0.2.0
+    """
+    _COURSE_CACHE.clear()
+
+
+def prefetch_courses():
+    """Caches all the available courses in a single pass, so that later
+    calls to :func:`get_course` do not need to search the courses.
+
+    If there are multiple courses with the same name and period, the
+    first one found is cached, which is the same course that
+    :func:`get_course` would return.
+
+    .. versionadded:: 0.2.0
+    """
+    for course in codepost.course.iter_available():
+        _COURSE_CACHE.setdefault((course.name, course.period), course)
+
+
 def course_str(course: Course, *, delim: str = " ") -> str:
     """Returns a str representation of a course.
 
@@ -210,6 +299,10 @@ def get_course_roster(
 ) -> SuccessOrNone[Roster]:
     """Gets the roster for the given course.
 
+    Fetched rosters are cached, so getting the roster of the same course
+    again does not make a request. Use :func:`invalidate_roster_cache`
+    to clear the cache.
+
     Args:
         course (|CourseArg|): The course.
         log (|bool|): Whether to show log messages.
@@ -219,6 +312,8 @@ def get_course_roster(
             The roster.
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.2.0
+       Fetched rosters are cached.
     """
     _logger = _get_logger(log)
 
@@ -226,10 +321,31 @@ def get_course_roster(
         return False, None
 
     _logger.info("Getting roster for course {!r}", course_str(course))
-    roster = codepost.roster.retrieve(course.id)
+    roster = _ROSTER_CACHE.get(course.id)
+    if roster is None:
+        roster = codepost.roster.retrieve(course.id)
+        _ROSTER_CACHE[course.id] = roster
     return True, roster
 
 
+def invalidate_roster_cache(course: Optional[Course] = None):
+    """Clears the cache of rosters fetched by :func:`get_course_roster`.
+
+    This should be called if the roster of a course is changed outside
+    of this package.
+
+    Args:
+        course (|Course|_): The course to clear the roster of. If not
+            given, the rosters of all courses are cleared.
+
+    .. versionadded:: 0.2.0
+    """
+    if course is None:
+        _ROSTER_CACHE.clear()
+    else:
+        _ROSTER_CACHE.pop(course.id, None)
+
+
 # =============================================================================
 
 
@@ -239,6 +355,11 @@ def get_assignment(
 ) -> SuccessOrNone[Assignment]:
     """Gets a codePost assignment from a course.
 
+    The assignments of each course are indexed by name the first time an
+    assignment is requested from that course, so later lookups do not
+    search through all the assignments. Use
+    :func:`invalidate_assignment_cache` to clear the index.
+
     Args:
         course (|CourseArg|): The course.
         assignment_name (|str|): The assignment name.
@@ -255,6 +376,8 @@ def get_assignment(
     .. versionchanged:: 0.2.0
        codePost does not allow multiple assignments to have the same
        name, so the extra checks for that were removed.
+    .. versionchanged:: 0.2.0
+       The assignments of each course are indexed by name.
     """
     _logger = _get_logger(log)
 
@@ -263,9 +386,84 @@ def get_assignment(
 
     _logger.info("Getting assignment {!r}", assignment_name)
 
-    for assignment in course.assignments:
-        if assignment.name == assignment_name:
-            return True, assignment
+    assignment = get_assignments_by_name(course).get(assignment_name)
+    if assignment is not None:
+        return True, assignment
 
     handle_error(log, ValueError, "Assignment {!r} not found", assignment_name)
     return False, None
+
+
+def _index_assignments(course: Course) -> Dict[str, Assignment]:
+    """Indexes the assignments of the given course by name.
+
+    Args:
+        course (|Course|_): The course.
+
+    Returns:
+        ``Dict`` [|str|, |Assignment|_]:
+            A mapping from assignment names to assignments.
+
+    .. versionadded:: 0.2.0
+    """
+    assignments = {
+        assignment.name: assignment for assignment in course.assignments
+    }
+    _ASSIGNMENT_INDEX[course.id] = assignments
+    return assignments
+
+
+def get_assignments_by_name(course: Course) -> Dict[str, Assignment]:
+    """Gets the assignments of the given course, indexed by name.
+
+    The index is built once per course and shared with
+    :func:`get_assignment`. Use :func:`invalidate_assignment_cache` to
+    clear it. The returned dict should not be modified.
+
+    Args:
+        course (|Course|_): The course.
+
+    Returns:
+        ``Dict`` [|str|, |Assignment|_]:
+            A mapping from assignment names to assignments, in the same
+            order as ``course.assignments``.
+
+    .. versionadded:: 0.2.0
+    """
+    assignments = _ASSIGNMENT_INDEX.get(course.id)
+    if assignments is None:
+        assignments = _index_assignments(course)
+    return assignments
+
+
+def prefetch_assignments(course: Course):
+    """Indexes all the assignments of the given course, so that later
+    calls to :func:`get_assignment` with this course do not need to
+    search the assignments.
+
+    This replaces any existing index for the course.
+
+    Args:
+        course (|Course|_): The course.
+
+    .. versionadded:: 0.2.0
+    """
+    _index_assignments(course)
+
+
+def invalidate_assignment_cache(course: Optional[Course] = None):
+    """Clears the index of assignments used by :func:`get_assignment`.
+
+    This should be called if assignments are created, renamed, or
+    deleted outside of this package.
+
+    Args:
+        course (|Course|_): The course to clear the assignments of. If
+            not given, the assignments of all courses are cleared.
+
+    .. versionadded:: 0.2.0
+    """
+    if course is None:
+        _ASSIGNMENT_INDEX.clear()
+    else:
+        _ASSIGNMENT_INDEX.pop(course.id, None)
@@ -1,29 +1,49 @@
 """
 Wrapper classes around |gspread Spreadsheet| and |gspread Worksheet|.
 """
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-lines,too-many-public-methods
 
 # Note that functions and methods in this module raise all exceptions,
 # regardless of whether ``log`` is True or not.
 
-# Note that this module does not get tested, since mostly everything is
-# either a thin wrapper around a ``gspread`` function or class, or makes
-# direct requests to the Google Sheets API.
+# Note that most of this module does not get tested, since mostly
+# everything is either a thin wrapper around a ``gspread`` function or
+# class, or makes direct requests to the Google Sheets API. Only the
+# requests that get built are tested, with the sending mocked out.
 
 # =============================================================================
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import contextlib
+import functools
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import gspread
-from gspread.utils import column_letter_to_index, rowcol_to_a1
+from gspread.utils import (
+    absolute_range_name,
+    column_letter_to_index,
+    fill_gaps,
+)
 
+from codepost_powertools._utils.request_batching import batch_requests
 from codepost_powertools.utils.sheets_api import (
     CellData,
     CellFormat,
     Color,
     ColorStyle,
+    Dimension,
     DimensionProperties,
     DimensionRange,
     ExtendedValue,
@@ -37,6 +57,7 @@ from codepost_powertools.utils.sheets_api import (
     TextFormat,
     VerticalAlign,
     WrapStrategy,
+    _gridrange,
 )
 
 # =============================================================================
@@ -58,8 +79,17 @@ class Spreadsheet(gspread.Spreadsheet):
     that there is no worksheet title conflict.
 
     .. versionadded:: 0.2.0
+
+    .. data:: BATCH_CHUNK_SIZE
+       :type: int
+       :value: 100
+
+       The maximum number of cached requests sent in a single batch
+       update by :meth:`update_worksheets` and :meth:`Worksheet.update`.
     """
 
+    BATCH_CHUNK_SIZE: int = 100
+
     @staticmethod
     def wrap(spreadsheet: gspread.Spreadsheet) -> Spreadsheet:
         """Converts a |gspread Spreadsheet| into an instance of the
@@ -77,7 +107,11 @@ class Spreadsheet(gspread.Spreadsheet):
         return spreadsheet
 
     def get_valid_worksheet_title(
-        self, title: str, *, fmt: str = "{title} {num}"
+        self,
+        title: str,
+        *,
+        fmt: str = "{title} {num}",
+        existing_titles: Optional[Set[str]] = None,
     ) -> str:
         """Returns a valid worksheet title from the given title.
 
@@ -90,6 +124,9 @@ class Spreadsheet(gspread.Spreadsheet):
             fmt (|str|): A template format for how the number is
                 appended to the title. Requires ``"{title}"`` and
                 ``"{num}"`` to be included in the string.
+            existing_titles (``Set`` [|str|]): The titles to check for
+                conflicts. If not given, the titles of the worksheets in
+                the spreadsheet are fetched.
 
         Returns:
             |str|: The valid title.
@@ -101,12 +138,13 @@ class Spreadsheet(gspread.Spreadsheet):
             raise ValueError(
                 '`fmt` is invalid: requires both "{title}" and "{num}"'
             )
-        worksheet_titles = set(
-            worksheet.title for worksheet in self.worksheets()
-        )
+        if existing_titles is None:
+            existing_titles = {
+                worksheet.title for worksheet in self.worksheets()
+            }
         ws_title = title
         count = 1
-        while ws_title in worksheet_titles:
+        while ws_title in existing_titles:
             ws_title = fmt.format(title=title, num=count)
             count += 1
         return ws_title
@@ -144,10 +182,305 @@ class Spreadsheet(gspread.Spreadsheet):
             self.get_valid_worksheet_title(title), rows, cols, index
         )
 
+    def add_worksheets(
+        self, titles: Iterable[str], *, rows: int = 1, cols: int = 1
+    ) -> List[gspread.Worksheet]:
+        """Adds new worksheets to the end of the spreadsheet in a single
+        batch update.
+
+        The titles will be changed as in :meth:`add_worksheet` so that
+        there is no worksheet title conflict, including between the new
+        worksheets.
+
+        Args:
+            titles (``Iterable`` [|str|]): The titles of the worksheets.
+            rows (|int|): The number of rows of each worksheet.
+            cols (|int|): The number of columns of each worksheet.
+
+        Returns:
+            ``List`` [|gspread Worksheet|]:
+                The worksheets, in the same order as ``titles``.
+
+        .. versionadded:: 0.2.0
+        """
+        _, added = self.rebuild_worksheets(
+            self.worksheets(), add=titles, rows=rows, cols=cols
+        )
+        return added
+
+    def get_cell_values(
+        self, worksheets: Iterable[gspread.Worksheet], cell_a1: str = "A1"
+    ) -> List[Optional[str]]:
+        """Gets the value of the same cell in each of the given
+        worksheets in a single batch request.
+
+        Args:
+            worksheets (``Iterable`` [|gspread Worksheet|]): The
+                worksheets.
+            cell_a1 (|str|): The cell in A1 notation.
+
+        Returns:
+            ``List`` [``Optional`` [|str|]]:
+                The formatted values of the cell, in the same order as
+                ``worksheets``. Empty cells have a value of None.
+
+        .. versionadded:: 0.2.0
+        """
+        ranges = [
+            absolute_range_name(worksheet.title, cell_a1)
+            for worksheet in worksheets
+        ]
+        if len(ranges) == 0:
+            return []
+        data = self.values_batch_get(ranges)
+        values: List[Optional[str]] = []
+        for value_range in data.get("valueRanges", []):
+            rows = value_range.get("values")
+            if not rows or not rows[0]:
+                values.append(None)
+            else:
+                values.append(rows[0][0])
+        return values
+
+    def get_worksheets_values(
+        self, worksheets: Iterable[Union[gspread.Worksheet, Worksheet]]
+    ) -> List[List[List[str]]]:
+        """Gets all the values of each of the given worksheets in a
+        single batch request.
+
+        Each result is the same as :meth:`Worksheet.get_values` for that
+        worksheet.
+
+        Args:
+            worksheets (``Iterable`` [``Union`` [|gspread Worksheet|,
+                |Worksheet|]]): The worksheets.
+
+        Returns:
+            ``List[List[List[str]]]``:
+                The values of each worksheet as a 2D list, in the same
+                order as ``worksheets``.
+
+        .. versionadded:: 0.2.0
+        """
+        ranges = [
+            absolute_range_name(worksheet.title) for worksheet in worksheets
+        ]
+        if len(ranges) == 0:
+            return []
+        data = self.values_batch_get(ranges)
+        return [
+            fill_gaps(value_range.get("values", []))
+            for value_range in data.get("valueRanges", [])
+        ]
+
+    def rebuild_worksheets(
+        self,
+        existing: Iterable[gspread.Worksheet],
+        *,
+        delete: Iterable[gspread.Worksheet] = (),
+        replace: Iterable[Tuple[gspread.Worksheet, int]] = (),
+        add: Iterable[str] = (),
+        rows: int = 1,
+        cols: int = 1,
+    ) -> Tuple[List[gspread.Worksheet], List[gspread.Worksheet]]:
+        """Deletes, replaces, and adds worksheets in a single batch
+        update.
+
+        The worksheets in ``delete`` are deleted. Each tuple in
+        ``replace`` should be a worksheet to replace and its 0-indexed
+        index; it is replaced with a new empty worksheet with the same
+        title at the same index. A new worksheet is added at the end for
+        each title in ``add``, with the title changed as in
+        :meth:`add_worksheet` if it conflicts with a remaining worksheet.
+
+        A temporary worksheet is added at the start of the batch update
+        and deleted at the end, so deleting or replacing every worksheet
+        is not an error.
+
+        Args:
+            existing (``Iterable`` [|gspread Worksheet|]): All the
+                current worksheets of the spreadsheet.
+            delete (``Iterable`` [|gspread Worksheet|]): The worksheets
+                to delete.
+            replace (``Iterable`` [``Tuple`` [|gspread Worksheet|,
+                |int|]]): The worksheets to replace and their indices.
+            add (``Iterable`` [|str|]): The titles of the worksheets to
+                add.
+            rows (|int|): The number of rows of the new worksheets.
+            cols (|int|): The number of columns of the new worksheets.
+
+        Returns:
+            ``Tuple`` [``List`` [|gspread Worksheet|], ``List``
+            [|gspread Worksheet|]]:
+                The replacement worksheets in the same order as
+                ``replace``, and the added worksheets in the same order
+                as ``add``.
+
+        .. versionadded:: 0.2.0
+        """
+
+        def add_sheet_request(title, *, index=None, sheet_id=None):
+            properties = {
+                "title": title,
+                "sheetType": "GRID",
+                "gridProperties": {"rowCount": rows, "columnCount": cols},
+            }
+            if index is not None:
+                properties["index"] = index
+            if sheet_id is not None:
+                properties["sheetId"] = sheet_id
+            return {"addSheet": {"properties": properties}}
+
+        def delete_sheet_request(sheet_id):
+            return {"deleteSheet": {"sheetId": sheet_id}}
+
+        existing = list(existing)
+        delete = list(delete)
+        replace = list(replace)
+
+        # get valid titles for the added worksheets without fetching the
+        # worksheets again
+        delete_ids = {worksheet.id for worksheet in delete}
+        titles = {
+            worksheet.title
+            for worksheet in existing
+            if worksheet.id not in delete_ids
+        }
+        add_titles = []
+        for title in add:
+            title = self.get_valid_worksheet_title(
+                title, existing_titles=titles
+            )
+            titles.add(title)
+            add_titles.append(title)
+
+        if len(delete) == 0 and len(replace) == 0 and len(add_titles) == 0:
+            return [], []
+
+        requests = []
+        temp_id = None
+        if len(delete) > 0 or len(replace) > 0:
+            # the temporary worksheet is given an unused id so that it
+            # can be deleted in the same batch update
+            existing_ids = {worksheet.id for worksheet in existing}
+            temp_id = 0
+            while temp_id in existing_ids:
+                temp_id += 1
+            temp_title = self.get_valid_worksheet_title(
+                "__temp",
+                existing_titles=titles.union(
+                    worksheet.title for worksheet in existing
+                ),
+            )
+            requests.append(add_sheet_request(temp_title, sheet_id=temp_id))
+        requests.extend(
+            delete_sheet_request(worksheet.id) for worksheet in delete
+        )
+        for worksheet, index in replace:
+            requests.append(delete_sheet_request(worksheet.id))
+            requests.append(add_sheet_request(worksheet.title, index=index))
+        requests.extend(add_sheet_request(title) for title in add_titles)
+        if temp_id is not None:
+            requests.append(delete_sheet_request(temp_id))
+
+        data = self.batch_update({"requests": requests})
+
+        new_worksheets = [
+            gspread.Worksheet(self, reply["addSheet"]["properties"])
+            for reply in data["replies"]
+            if "addSheet" in reply
+        ]
+        if temp_id is not None:
+            # skip the temporary worksheet
+            new_worksheets = new_worksheets[1:]
+        num_replaced = len(replace)
+        return new_worksheets[:num_replaced], new_worksheets[num_replaced:]
+
+    def set_worksheets_values(
+        self,
+        data: Iterable[Tuple[Worksheet, List[List[Any]], str]],
+    ):
+        """Sets the values of multiple worksheets in a single batch
+        update.
+
+        Each tuple should be the worksheet, the values, and the range in
+        A1 notation, which work the same as in
+        :meth:`Worksheet.set_values`.
+
+        Args:
+            data (``Iterable`` [``Tuple`` [|Worksheet|,
+                ``List[List[Any]]``, |str|]]): The values to set.
+
+        .. versionadded:: 0.2.0
+        """
+        value_ranges = [
+            {
+                "range": absolute_range_name(worksheet.title, range_a1),
+                "values": values,
+            }
+            for worksheet, values, range_a1 in data
+        ]
+        if len(value_ranges) == 0:
+            return
+        self.values_batch_update(
+            body={"valueInputOption": "RAW", "data": value_ranges}
+        )
+
+    def _send_requests(self, requests: List[Dict]):
+        """Sends the given requests in batch updates of at most
+        :data:`BATCH_CHUNK_SIZE` requests each, in order.
+
+        Consecutive requests that apply the same properties to touching
+        ranges are merged into a single request first.
+
+        If an exception occurs, the remaining chunks are not sent.
+
+        .. versionadded:: 0.2.0
+        """
+        for batch in batch_requests(requests, self.BATCH_CHUNK_SIZE):
+            self.batch_update({"requests": batch})
+
+    def update_worksheets(self, worksheets: Iterable[Worksheet]):
+        """Updates the spreadsheet with the cached requests and values
+        of all the given worksheets in batch updates.
+
+        This works like :meth:`Worksheet.update`, except the requests
+        and values of every worksheet are sent together, in the order of
+        ``worksheets``. All the pending requests will be cleared, even
+        if an exception occurs.
+
+        Args:
+            worksheets (``Iterable`` [|Worksheet|]): The worksheets.
+
+        .. versionadded:: 0.2.0
+        """
+        # pylint: disable=protected-access
+        worksheets = list(worksheets)
+        requests: List[Dict] = []
+        values: List[Tuple[Worksheet, List[List[Any]], str]] = []
+        for worksheet in worksheets:
+            requests.extend(worksheet._pending_requests)
+            values.extend(
+                (worksheet, worksheet_values, range_a1)
+                for worksheet_values, range_a1 in worksheet._pending_values
+            )
+        try:
+            if len(requests) > 0:
+                self._send_requests(requests)
+                for worksheet in worksheets:
+                    worksheet._apply_sent_freezes()
+            self.set_worksheets_values(values)
+        finally:
+            for worksheet in worksheets:
+                worksheet._pending_requests.clear()
+                worksheet._pending_values.clear()
+                worksheet._pending_freezes.clear()
+
 
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1024)
 def col_letter_to_index(col: str) -> int:
     """Converts a column letter to its numerical index.
 
@@ -165,6 +498,7 @@ def col_letter_to_index(col: str) -> int:
     return column_letter_to_index(col)
 
 
+@functools.lru_cache(maxsize=None)
 def col_index_to_letter(col: int) -> str:
     """Converts a column index to its A1 notation letter.
 
@@ -184,9 +518,12 @@ def col_index_to_letter(col: int) -> str:
         raise gspread.exceptions.InvalidInputValue(
             "invalid value: {}, must be a column 1-indexed number".format(col)
         )
-    a1 = rowcol_to_a1(1, col)
-    # remove the row number "1" at the end
-    return a1[:-1]
+    # convert to bijective base 26, where "A" is 1 and "Z" is 26
+    letters = []
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters.append(chr(ord("A") + remainder))
+    return "".join(reversed(letters))
 
 
 # =============================================================================
@@ -194,6 +531,58 @@ def col_index_to_letter(col: int) -> str:
 ValidColor = Union[Color, Tuple[int, int, int], Tuple[float, float, float]]
 
 
+@functools.lru_cache(maxsize=512)
+def _make_format_cell_data(
+    font_family: Optional[str],
+    *,
+    font_size: Optional[int],
+    bold: Optional[bool],
+    italic: Optional[bool],
+    strikethrough: Optional[bool],
+    underline: Optional[bool],
+    background_color: Optional[ValidColor],
+    text_color: Optional[ValidColor],
+    text_align: Optional[HorizontalAlign],
+    vertical_align: Optional[VerticalAlign],
+    wrap: Optional[WrapStrategy],
+) -> CellData:
+    """Returns the ``CellData`` for :meth:`Worksheet.format_cell`.
+
+    The same formats are usually applied many times, so the objects are
+    cached by their arguments. ``CellData`` returns a copy of its JSON
+    value, so it is safe to share.
+
+    .. versionadded:: 0.2.0
+    """
+    fmt_kwargs: Dict[str, Any] = {}
+
+    if background_color is not None:
+        fmt_kwargs["background_color_style"] = ColorStyle.auto(
+            background_color
+        )
+    if text_align is not None:
+        fmt_kwargs["horizontal_alignment"] = text_align
+    if vertical_align is not None:
+        fmt_kwargs["vertical_alignment"] = vertical_align
+    if wrap is not None:
+        fmt_kwargs["wrap_strategy"] = wrap
+
+    foreground_color_style = None
+    if text_color is not None:
+        foreground_color_style = ColorStyle.auto(text_color)
+    fmt_kwargs["text_format"] = TextFormat(
+        foreground_color_style=foreground_color_style,
+        font_family=font_family,
+        font_size=font_size,
+        bold=bold,
+        italic=italic,
+        strikethrough=strikethrough,
+        underline=underline,
+    )
+
+    return CellData(user_entered_format=CellFormat(**fmt_kwargs))
+
+
 class Worksheet:
     """A wrapper class around |gspread Worksheet|.
 
@@ -235,6 +624,14 @@ class Worksheet:
         self._worksheet: gspread.Worksheet = worksheet
         self._id: int = worksheet.id
         self._pending_requests: List[Dict] = []
+        self._pending_values: List[Tuple[List[List[Any]], str]] = []
+        self._in_batch: bool = False
+        # `freeze()` uses a batch request, which doesn't update the
+        # properties cached by `gspread`, so the counts are kept here and
+        # only changed once the cached freezes are sent successfully
+        self._frozen_rows: int = worksheet.frozen_row_count
+        self._frozen_cols: int = worksheet.frozen_col_count
+        self._pending_freezes: List[Tuple[Optional[int], Optional[int]]] = []
 
     def __str__(self) -> str:
         return str(self._worksheet)
@@ -282,17 +679,36 @@ class Worksheet:
     def num_frozen_rows(self) -> int:
         """The number of frozen rows in the worksheet.
 
+        Cached :meth:`freeze` calls are included once they are sent
+        successfully.
+
         .. versionadded:: 0.2.0
         """
-        return self._worksheet.frozen_row_count
+        return self._frozen_rows
 
     @property
     def num_frozen_cols(self) -> int:
         """The number of frozen columns in the worksheet.
 
+        Cached :meth:`freeze` calls are included once they are sent
+        successfully.
+
         .. versionadded:: 0.2.0
         """
-        return self._worksheet.frozen_col_count
+        return self._frozen_cols
+
+    def _apply_sent_freezes(self):
+        """Updates the frozen counts with the cached :meth:`freeze`
+        calls, after they were sent successfully.
+
+        .. versionadded:: 0.2.0
+        """
+        for rows, cols in self._pending_freezes:
+            if rows is not None and rows >= 0:
+                self._frozen_rows = rows
+            if cols is not None and cols >= 0:
+                self._frozen_cols = cols
+        self._pending_freezes.clear()
 
     def _get_grid_range(self, range_a1: str) -> GridRange:
         return GridRange.from_range(sheet_id=self._id, range_a1=range_a1)
@@ -304,21 +720,55 @@ class Worksheet:
         If a method doesn't have the ``update`` keyword argument, its
         change takes effect immediately.
 
-        The requests are processed in the given order. If an exception
-        occurs, the rest of the requests are ignored. However, all the
-        pending requests will be cleared, even if they weren't
-        processed. (This is done so that interactive Python sessions can
-        run into errors and still be used after.)
+        The requests are processed in the given order, in batch updates
+        of at most :data:`Spreadsheet.BATCH_CHUNK_SIZE` requests each.
+        Then, any cached values from :meth:`set_values` are set in a
+        single values batch update. If an exception occurs, the rest of
+        the requests are ignored, but the batches sent before it stay
+        applied. However, all the pending requests will be cleared, even
+        if they weren't processed. (This is done so that interactive
+        Python sessions can run into errors and still be used after.)
+
+        Inside a :meth:`batch_update` block, this does nothing; the
+        update happens once when the block exits.
 
         .. versionadded:: 0.2.0
         """
-        if len(self._pending_requests) == 0:
+        if self._in_batch:
             return
-        body = {"requests": self._pending_requests}
+        self._spreadsheet.update_worksheets([self])
+
+    @contextlib.contextmanager
+    def batch_update(self) -> Iterator[Worksheet]:
+        """A context manager that caches all the requests made inside
+        the block and updates the worksheet once when it exits.
+
+        Inside the block, ``update=True`` and calls to :meth:`update`
+        are deferred until the end of the block. If an exception is
+        raised inside the block, nothing is sent, and the requests stay
+        cached until the next :meth:`update`. Nested blocks only update
+        when the outermost block exits.
+
+        Examples:
+
+        .. code-block:: python
+
+           with worksheet.batch_update():
+               worksheet.freeze(rows=1)
+               worksheet.format_cell("A1", bold=True, update=True)
+               # nothing has been sent yet
+
+        .. versionadded:: 0.2.0
+        """
+        if self._in_batch:
+            yield self
+            return
+        self._in_batch = True
         try:
-            self._spreadsheet.batch_update(body)
+            yield self
         finally:
-            self._pending_requests.clear()
+            self._in_batch = False
+        self.update()
 
     def get_cell(self, cell_a1: str) -> gspread.Cell:
         """Gets a cell of the worksheet.
@@ -335,12 +785,43 @@ class Worksheet:
     def get_values(self) -> List[List[str]]:
         """Gets all the values of the worksheet as a 2D list.
 
+        To get the values of multiple worksheets in a single request,
+        use :meth:`Spreadsheet.get_worksheets_values`. To get the values
+        of a large worksheet in chunks, use :meth:`iter_values`.
+
         :rtype: ``List[List[str]]``
 
         .. versionadded:: 0.2.0
         """
         return self._worksheet.get_values()
 
+    def iter_values(self, chunk_rows: int = 1000) -> Iterator[List[List[str]]]:
+        """Gets the values of the worksheet in chunks of rows.
+
+        Each chunk is fetched only when it is needed, so large
+        worksheets can be processed without loading every row at once.
+        The rows of each chunk are padded to the width of its longest
+        row, and the last chunks may be shorter or empty if the bottom
+        rows of the worksheet are empty.
+
+        Args:
+            chunk_rows (|int|): The number of rows in each chunk.
+
+        Yields:
+            ``List[List[str]]``: The values of each chunk of rows.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is not positive.
+
+        .. versionadded:: 0.2.0
+        """
+        if chunk_rows <= 0:
+            raise ValueError("`chunk_rows` must be positive")
+        num_rows = self.num_rows
+        for start in range(1, num_rows + 1, chunk_rows):
+            end = min(start + chunk_rows - 1, num_rows)
+            yield fill_gaps(self._worksheet.get(f"{start}:{end}"))
+
     def get_records(
         self,
         empty2zero: bool = False,
@@ -366,20 +847,34 @@ class Worksheet:
             empty2zero=empty2zero, head=header_row, default_blank=default_blank
         )
 
-    def set_values(self, values: List[List[Any]], range_a1: str = "A1"):
+    def set_values(
+        self,
+        values: List[List[Any]],
+        range_a1: str = "A1",
+        *,
+        update: bool = True,
+    ):
         """Sets the values of the worksheet.
 
         The data will be inserted starting at the top-left cell of
         ``range_a1``. The size of the range itself doesn't matter, so a
         single value of the top-left cell of the data is enough.
 
+        If ``update`` is False, the values are cached and sent together
+        with the values of other cached calls in a single batch update
+        by :meth:`update`.
+
         Args:
             values (``List[List[Any]]``): The values.
             range_a1 (|str|): The range in A1 notation.
+            update (|bool|): Whether to update the worksheet.
 
         .. versionadded:: 0.2.0
         """
-        self._worksheet.update(range_a1, values)
+        if update and not self._in_batch:
+            self._worksheet.update(range_a1, values)
+        else:
+            self._pending_values.append((values, range_a1))
 
     def add_formula(
         self, range_a1: str, formula: str, *, update: bool = False
@@ -449,14 +944,12 @@ class Worksheet:
         .. versionadded:: 0.2.0
         """
 
-        def escape_quotes(s: str) -> str:
-            return s.replace('"', '\\"')
-
-        formula = [f'=HYPERLINK("{link}"']
-        if text is not None:
-            formula.append(f', "{escape_quotes(str(text))}"')
-        formula.append(")")
-        self.add_formula(range_a1, "".join(formula), update=update)
+        if text is None:
+            formula = f'=HYPERLINK("{link}")'
+        else:
+            text = str(text).replace('"', '\\"')
+            formula = f'=HYPERLINK("{link}", "{text}")'
+        self.add_formula(range_a1, formula, update=update)
 
     def resize(
         self, *, rows: Optional[int] = None, cols: Optional[int] = None
@@ -504,6 +997,12 @@ class Worksheet:
         range of rows. For ``hide_cols``, each element should be the
         column number, column letter, or a range of columns.
 
+        If ``update`` is True, all the requests are sent together as in
+        :meth:`update`. Each batch update of at most
+        :data:`Spreadsheet.BATCH_CHUNK_SIZE` requests is applied
+        all-or-nothing, but the chunks sent before an error stay
+        applied.
+
         Args:
             freeze_rows (|int|): The number of rows to freeze.
             freeze_cols (|int|): The number of columns to freeze.
@@ -526,53 +1025,77 @@ class Worksheet:
         .. versionadded:: 0.2.0
         """
 
-        def col_to_a1(col: Union[str, int]) -> str:
-            if isinstance(col, str):
-                return col
-            return col_index_to_letter(col)
-
-        # freeze
-        if freeze_rows is not None or freeze_cols is not None:
-            # update immediately so that it crashes if everything is frozen
-            self.freeze(rows=freeze_rows, cols=freeze_cols, update=update)
-
-        # hide
-        if hide_rows is not None:
-            for row in hide_rows:
-                self.hide_row(row)
-            # update immediately so that it crashes if everything is hidden
-            if update:
-                self.update()
-        if hide_cols is not None:
-            for col in hide_cols:
-                self.hide_col(col_to_a1(col))
-            # update immediately so that it crashes if everything is hidden
-            if update:
-                self.update()
-
-        # size
-        if row_heights is not None:
-            for row, height in row_heights:
-                self.set_row_height(row, height)
-        if col_widths is not None:
-            for col, width in col_widths:
-                self.set_col_width(col_to_a1(col), width)
-
-        # formats
-        if range_formats is not None:
-            for range_a1, kwargs in range_formats:
-                self.format_cell(range_a1, **kwargs)
-        if number_formats is not None:
-            for range_a1, kwargs in number_formats:
-                self.format_number_cell(range_a1, **kwargs)
-
-        # merge
-        if merge_ranges is not None:
-            for range_a1 in merge_ranges:
-                self.merge_cells(range_a1)
+        def dim_range(
+            dimension: Dimension, range_a1: Union[str, int]
+        ) -> DimensionRange:
+            # build single rows and columns from their numbers directly
+            # instead of converting them to A1 notation and parsing it
+            if isinstance(range_a1, int):
+                return DimensionRange(
+                    sheet_id=self._id,
+                    dimension=dimension,
+                    start_index=range_a1 - 1,
+                    end_index=range_a1,
+                )
+            return DimensionRange.from_range(
+                sheet_id=self._id, dimension=dimension, range_a1=range_a1
+            )
 
-        if update:
-            self.update()
+        def sort_numbers_first(
+            values: Iterable[Union[str, int]]
+        ) -> List[Union[str, int]]:
+            numbers = []
+            ranges = []
+            for value in values:
+                if isinstance(value, int):
+                    numbers.append(value)
+                else:
+                    ranges.append(value)
+            return [*sorted(numbers), *ranges]
+
+        # when updating, send everything together at the end; the freeze
+        # and hide requests are queued first, so if everything is frozen
+        # or hidden, the error stops the later chunks from being sent
+        batch = self.batch_update() if update else contextlib.nullcontext()
+        with batch:
+            # freeze
+            if freeze_rows is not None or freeze_cols is not None:
+                self.freeze(rows=freeze_rows, cols=freeze_cols)
+
+            # hide
+            # hiding doesn't depend on order, so the numbers are sorted
+            # to let contiguous runs be merged into single requests
+            if hide_rows is not None:
+                for row in sort_numbers_first(hide_rows):
+                    self._hide(dim_range(Dimension.ROWS, row))
+            if hide_cols is not None:
+                for col in sort_numbers_first(hide_cols):
+                    self._hide(dim_range(Dimension.COLUMNS, col))
+
+            # size
+            if row_heights is not None:
+                for row, height in row_heights:
+                    self._set_row_col_size(
+                        dim_range(Dimension.ROWS, row), height
+                    )
+            if col_widths is not None:
+                for col, width in col_widths:
+                    self._set_row_col_size(
+                        dim_range(Dimension.COLUMNS, col), width
+                    )
+
+            # formats
+            if range_formats is not None:
+                for range_a1, kwargs in range_formats:
+                    self.format_cell(range_a1, **kwargs)
+            if number_formats is not None:
+                for range_a1, kwargs in number_formats:
+                    self.format_number_cell(range_a1, **kwargs)
+
+            # merge
+            if merge_ranges is not None:
+                for range_a1 in merge_ranges:
+                    self.merge_cells(range_a1)
 
     def freeze(
         self,
@@ -608,6 +1131,7 @@ class Worksheet:
                     ),
                 ).updateRequest()
             )
+            self._pending_freezes.append((rows, cols))
 
         if update:
             self.update()
@@ -758,6 +1282,9 @@ class Worksheet:
     ):
         """Merges the given range of cells.
 
+        Merging a single cell does nothing, so no request is made for
+        it.
+
         Args:
             range_a1 (|str|): The cell range in A1 notation.
             merge_type (|MergeType|): The merge type.
@@ -772,9 +1299,23 @@ class Worksheet:
         .. versionadded:: 0.2.0
         """
 
-        self._pending_requests.append(
-            self._get_grid_range(range_a1).mergeRequest(merge_type=merge_type)
-        )
+        # the parsed indices are plain ints, unlike the `GridRange` JSON
+        grid = _gridrange(range_a1)
+
+        def span(dim: str) -> Optional[int]:
+            start = grid.get(f"start{dim}Index")
+            end = grid.get(f"end{dim}Index")
+            if start is None or end is None:
+                # unbounded
+                return None
+            return end - start
+
+        if not (span("Row") == 1 and span("Column") == 1):
+            self._pending_requests.append(
+                self._get_grid_range(range_a1).mergeRequest(
+                    merge_type=merge_type
+                )
+            )
 
         if update:
             self.update()
@@ -798,6 +1339,8 @@ class Worksheet:
     ):
         """Formats the given cell(s).
 
+        If no formats are given, no request is made.
+
         Args:
             range_a1 (|str|): The cell range in A1 notation.
             font_family (|str|): The font family.
@@ -824,34 +1367,27 @@ class Worksheet:
         .. versionadded:: 0.2.0
         """
 
-        fmt_kwargs: Dict[str, Any] = {}
+        def hashable(color: Optional[ValidColor]) -> Optional[ValidColor]:
+            # allow colors given as lists
+            if isinstance(color, list):
+                return tuple(color)
+            return color
 
-        if background_color is not None:
-            fmt_kwargs["background_color_style"] = ColorStyle.auto(
-                background_color
-            )
-        if text_align is not None:
-            fmt_kwargs["horizontal_alignment"] = text_align
-        if vertical_align is not None:
-            fmt_kwargs["vertical_alignment"] = vertical_align
-        if wrap is not None:
-            fmt_kwargs["wrap_strategy"] = wrap
-
-        foreground_color_style = None
-        if text_color is not None:
-            foreground_color_style = ColorStyle.auto(text_color)
-        fmt_kwargs["text_format"] = TextFormat(
-            foreground_color_style=foreground_color_style,
-            font_family=font_family,
+        cell_data = _make_format_cell_data(
+            font_family,
             font_size=font_size,
             bold=bold,
             italic=italic,
             strikethrough=strikethrough,
             underline=underline,
+            background_color=hashable(background_color),
+            text_color=hashable(text_color),
+            text_align=text_align,
+            vertical_align=vertical_align,
+            wrap=wrap,
         )
-
-        if len(fmt_kwargs) > 0:
-            cell_data = CellData(user_entered_format=CellFormat(**fmt_kwargs))
+        # skip the request if no formats were given
+        if len(cell_data.fields()) > 0:
             self._pending_requests.append(
                 cell_data.updateRequest(self._get_grid_range(range_a1))
             )
@@ -11,10 +11,33 @@ Contains helpers for communicating with the Google Sheets API.
 
 from __future__ import annotations
 
+import functools
 from enum import Enum, auto
 from typing import Any, Dict, Iterable, List, Optional, Type, Union, overload
 
-from gspread.utils import a1_range_to_grid_range as gridrange
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_gridrange(range_a1: str) -> Dict[str, int]:
+    # pylint: disable=import-outside-toplevel
+    from gspread.utils import a1_range_to_grid_range
+
+    return a1_range_to_grid_range(range_a1)
+
+
+def _gridrange(range_a1: str) -> Dict[str, int]:
+    """Converts an A1 range into a ``GridRange`` dict without a sheet id.
+
+    ``gspread`` is slow to import, so it is only imported when a range
+    is actually converted. Parsed ranges are cached, since the same
+    ranges are usually formatted many times; a copy is returned so that
+    the cached dict can't be changed.
+
+    .. versionadded:: 0.2.0
+    """
+    return dict(_parse_gridrange(range_a1))
+
 
 # =============================================================================
 
@@ -215,7 +238,7 @@ class DimensionRange(ToJson):
             dim = "Row"
         elif dimension == Dimension.COLUMNS:
             dim = "Column"
-        grid = gridrange(range_a1)
+        grid = _gridrange(range_a1)
         return cls(
             sheet_id=sheet_id,
             dimension=dimension,
@@ -1343,7 +1366,7 @@ class GridRange(ToJson):
     @classmethod
     def from_range(cls, *, sheet_id: int, range_a1: str):
         grid_range = cls(sheet_id=sheet_id)
-        for key, value in gridrange(range_a1).items():
+        for key, value in _gridrange(range_a1).items():
             grid_range._json[key] = value
         return grid_range
 
@@ -5,6 +5,7 @@ Tests the file input/output operation functions.
 # =============================================================================
 
 import re
+import shutil
 
 import pytest
 
@@ -185,6 +186,7 @@ class TestValidateCsv:
         {"tmp_file": "file.txt"},
         {"tmp_file": "file.csv.txt"},
         {"tmp_file": "file"},
+        {"tmp_file": ".csv"},
     )
     class TestError:
         """Tests function calls that are expected to have an error."""
@@ -227,7 +229,7 @@ class TestSaveCsv:
     """Tests the function
     :func:`~codepost_powertools._utils.file_io.save_csv`.
 
-    We will assume that the ``comma`` package properly handles invalid
+    We will assume that the ``csv`` module properly handles invalid
     data, so only valid data will be tested.
     """
 
@@ -277,3 +279,26 @@ class TestSaveCsv:
         assert tmp_file.read_text(encoding="utf-8") == self.DATA_STR
         # check log messages
         track_logs.saw_msg_logged("INFO", rf"Saving {description} to")
+
+    @parametrize_indirect({"tmp_file": "file.csv"})
+    def test_lazy_data(self, track_no_error_logs, tmp_file):
+        success = file_io.save_csv(
+            (row for row in self.DATA), tmp_file, log=True
+        )
+        assert success
+        assert tmp_file.read_text(encoding="utf-8") == self.DATA_STR
+
+    @parametrize_indirect({"tmp_file": "file.csv"})
+    def test_empty_data(self, track_no_error_logs, tmp_file):
+        success = file_io.save_csv([], tmp_file, log=True)
+        assert success
+        assert tmp_file.exists()
+        assert tmp_file.read_text(encoding="utf-8") == ""
+
+    def test_directory_removed(self, track_no_error_logs, tmp_path):
+        folder = tmp_path / "output"
+        filepath = folder / "file.csv"
+        assert file_io.save_csv(self.DATA, filepath, log=True)
+        shutil.rmtree(folder)
+        assert file_io.save_csv(self.DATA, filepath, log=True)
+        assert filepath.read_text(encoding="utf-8") == self.DATA_STR
@@ -0,0 +1,225 @@
+"""
+Tests the ``gspread`` utilities.
+
+The tests in this file are defined in the following order:
+- authenticate_client()
+- open_spreadsheet()
+
+``gspread`` will be mocked, so no requests are made.
+"""
+
+# =============================================================================
+
+import time
+
+import gspread
+import pytest
+
+from codepost_powertools._utils import gspread_utils
+
+# =============================================================================
+
+
+class MockCredentials:
+    """A mock for OAuth credentials."""
+
+    def __init__(self, *, expired=False):
+        self.expired = expired
+        self.refresh_token = "token"
+        self.num_refreshes = 0
+
+    def refresh(self, request):
+        self.num_refreshes += 1
+        self.expired = False
+
+
+class MockClient:
+    """A mock for a ``gspread`` client."""
+
+    def __init__(self, credentials):
+        self.auth = credentials
+
+
+class MockOAuth:
+    """A mock for ``gspread.oauth()`` that records its calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.expired = False
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return MockClient(MockCredentials(expired=self.expired))
+
+
+@pytest.fixture(name="mock_oauth")
+def fixture_mock_oauth(monkeypatch):
+    """Mocks ``gspread.oauth()`` and resets the global client."""
+    mock_oauth = MockOAuth()
+    monkeypatch.setattr(gspread, "oauth", mock_oauth)
+    monkeypatch.setattr(gspread_utils, "_GLOBAL_CLIENT", None)
+    monkeypatch.setattr(gspread_utils, "_GLOBAL_CLIENT_CREDENTIALS", None)
+    yield mock_oauth
+
+
+class MockOpenClient:
+    """A mock for a ``gspread`` client that opens spreadsheets."""
+
+    def __init__(self, sheet_names):
+        self.auth = MockCredentials()
+        self.sheet_names = sheet_names
+        self.opened = []
+
+    def open(self, sheet_name):
+        self.opened.append(sheet_name)
+        if sheet_name not in self.sheet_names:
+            raise gspread.SpreadsheetNotFound
+        return gspread.Spreadsheet.__new__(gspread.Spreadsheet)
+
+
+class MockClock:
+    """A mock for ``time.monotonic()``."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(name="mock_open_client")
+def fixture_mock_open_client(monkeypatch):
+    """Sets the global client to a mock and clears the spreadsheet
+    cache."""
+    client = MockOpenClient({"Sheet", "Other"})
+    monkeypatch.setattr(gspread_utils, "_GLOBAL_CLIENT", client)
+    monkeypatch.setattr(gspread_utils, "_SPREADSHEET_CACHE", {})
+    yield client
+
+
+@pytest.fixture(name="mock_clock")
+def fixture_mock_clock(monkeypatch):
+    """Mocks the clock used to expire the spreadsheet cache."""
+    clock = MockClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    yield clock
+
+
+@pytest.fixture(name="credentials_file")
+def fixture_credentials_file(tmp_path):
+    """Creates an OAuth credentials file."""
+    path = tmp_path / "credentials" / "client_credentials.json"
+    path.parent.mkdir()
+    path.write_text("{}")
+    yield path
+
+
+# =============================================================================
+
+
+class TestAuthenticateClient:
+    """Tests the function :func:`gspread_utils.authenticate_client`."""
+
+    def test_reuse(self, mock_oauth, credentials_file):
+        success, client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file
+        )
+        assert success is True
+        # equivalent paths also reuse the client
+        same_file = credentials_file.parent / ".." / "credentials"
+        _, same_client = gspread_utils.authenticate_client(
+            credentials_file=str(same_file / credentials_file.name)
+        )
+        assert same_client is client
+        assert len(mock_oauth.calls) == 1
+        assert mock_oauth.calls[0]["authorized_user_filename"] == (
+            credentials_file.with_name(
+                gspread_utils.AUTHORIZED_CLIENT_FILENAME
+            )
+        )
+
+    def test_new_path(self, mock_oauth, credentials_file):
+        other_file = credentials_file.with_name("other_credentials.json")
+        other_file.write_text("{}")
+        _, client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file
+        )
+        _, other_client = gspread_utils.authenticate_client(
+            credentials_file=other_file
+        )
+        assert other_client is not client
+        assert len(mock_oauth.calls) == 2
+        assert mock_oauth.calls[1]["credentials_filename"] == other_file
+
+    def test_force_reauth(self, mock_oauth, credentials_file):
+        _, client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file
+        )
+        _, new_client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file, force_reauth=True
+        )
+        assert new_client is not client
+        assert len(mock_oauth.calls) == 2
+
+    def test_expired(self, mock_oauth, credentials_file):
+        mock_oauth.expired = True
+        _, client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file
+        )
+        # the expired credentials are refreshed locally
+        assert client.auth.num_refreshes == 1
+        assert client.auth.expired is False
+        assert len(mock_oauth.calls) == 1
+
+        # a client that expires later gets replaced
+        client.auth.expired = True
+        _, new_client = gspread_utils.authenticate_client(
+            credentials_file=credentials_file
+        )
+        assert new_client is not client
+        assert len(mock_oauth.calls) == 2
+
+    def test_not_found(self, mock_oauth, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            gspread_utils.authenticate_client(
+                credentials_file=tmp_path / "missing.json"
+            )
+        assert mock_oauth.calls == []
+
+
+class TestOpenSpreadsheet:
+    """Tests the function :func:`gspread_utils.open_spreadsheet`."""
+
+    def test_hit(self, mock_open_client, mock_clock):
+        success, spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        assert success is True
+        assert isinstance(spreadsheet, gspread_utils.Spreadsheet)
+        mock_clock.now += gspread_utils._SPREADSHEET_CACHE_TTL - 1
+        _, same_spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        assert same_spreadsheet is spreadsheet
+        # other names are not cached
+        _, other_spreadsheet = gspread_utils.open_spreadsheet("Other")
+        assert other_spreadsheet is not spreadsheet
+        assert mock_open_client.opened == ["Sheet", "Other"]
+
+    def test_expiry(self, mock_open_client, mock_clock):
+        _, spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        mock_clock.now += gspread_utils._SPREADSHEET_CACHE_TTL
+        _, new_spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        assert new_spreadsheet is not spreadsheet
+        assert mock_open_client.opened == ["Sheet", "Sheet"]
+
+    def test_invalidate(self, mock_open_client, mock_clock):
+        _, spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        gspread_utils.invalidate_spreadsheet_cache()
+        _, new_spreadsheet = gspread_utils.open_spreadsheet("Sheet")
+        assert new_spreadsheet is not spreadsheet
+        assert mock_open_client.opened == ["Sheet", "Sheet"]
+
+    def test_not_found(self, mock_open_client, mock_clock):
+        with pytest.raises(gspread.SpreadsheetNotFound):
+            gspread_utils.open_spreadsheet("Missing")
+        # failures are not cached
+        with pytest.raises(gspread.SpreadsheetNotFound):
+            gspread_utils.open_spreadsheet("Missing")
+        assert mock_open_client.opened == ["Missing", "Missing"]
@@ -0,0 +1,139 @@
+"""
+Tests the request batching helpers.
+"""
+
+# =============================================================================
+
+from codepost_powertools._utils.request_batching import (
+    batch_requests,
+    merge_requests,
+)
+from codepost_powertools.utils.sheets_api import (
+    CellData,
+    CellFormat,
+    DimensionProperties,
+    DimensionRange,
+    ExtendedValue,
+    GridRange,
+    TextFormat,
+)
+
+# =============================================================================
+
+
+def row_height_request(row, height, sheet_id=0):
+    return DimensionProperties(pixel_size=height).updateRequest(
+        DimensionRange.rows(sheet_id=sheet_id, range_a1=row)
+    )
+
+
+def bold_request(range_a1, sheet_id=0):
+    cell_data = CellData(
+        user_entered_format=CellFormat(text_format=TextFormat(bold=True))
+    )
+    return cell_data.updateRequest(
+        GridRange.from_range(sheet_id=sheet_id, range_a1=range_a1)
+    )
+
+
+def formula_request(range_a1, formula):
+    cell_data = CellData(user_entered_value=ExtendedValue.formula(formula))
+    return cell_data.updateRequest(
+        GridRange.from_range(sheet_id=0, range_a1=range_a1)
+    )
+
+
+def get_range(request):
+    ((_, body),) = request.items()
+    return body["range"]
+
+
+# =============================================================================
+
+
+class TestMergeRequests:
+    """Tests the function :func:`request_batching.merge_requests`."""
+
+    def test_empty(self):
+        assert merge_requests([]) == []
+
+    def test_dimension_touching(self):
+        requests = [row_height_request(row, 30) for row in ("1", "2", "3")]
+        merged = merge_requests(requests)
+        assert len(merged) == 1
+        assert get_range(merged[0])["startIndex"] == 0
+        assert get_range(merged[0])["endIndex"] == 3
+
+    def test_dimension_not_merged(self):
+        requests = [
+            row_height_request("1", 30),
+            # different size
+            row_height_request("2", 40),
+            # gap
+            row_height_request("4", 40),
+            # different sheet
+            row_height_request("5", 40, sheet_id=1),
+        ]
+        assert merge_requests(requests) == requests
+
+    def test_only_consecutive(self):
+        requests = [
+            row_height_request("1", 30),
+            bold_request("A1"),
+            row_height_request("2", 30),
+        ]
+        assert merge_requests(requests) == requests
+
+    def test_repeat_cell_touching(self):
+        requests = [bold_request(r) for r in ("A1", "A2", "B1:B2")]
+        merged = merge_requests(requests)
+        assert len(merged) == 1
+        assert get_range(merged[0]) == {
+            "sheetId": 0,
+            "startRowIndex": 0,
+            "endRowIndex": 2,
+            "startColumnIndex": 0,
+            "endColumnIndex": 2,
+        }
+
+    def test_repeat_cell_not_rectangle(self):
+        requests = [bold_request("A1"), bold_request("B2")]
+        assert merge_requests(requests) == requests
+
+    def test_formulas_not_merged(self):
+        requests = [formula_request("A1", "=B1"), formula_request("A2", "=B1")]
+        assert merge_requests(requests) == requests
+
+    def test_not_mutated(self):
+        requests = [row_height_request("1", 30), row_height_request("2", 30)]
+        before = [dict(request) for request in requests]
+        merge_requests(requests)
+        assert requests == before
+        assert get_range(requests[0])["endIndex"] == 1
+
+
+# =============================================================================
+
+
+class TestBatchRequests:
+    """Tests the function :func:`request_batching.batch_requests`."""
+
+    def test_empty(self):
+        assert list(batch_requests([], 2)) == []
+
+    def test_chunks(self):
+        # alternating sizes, so none of the requests are merged
+        requests = [
+            row_height_request(str(row), 30 + row % 2) for row in range(1, 6)
+        ]
+        assert list(batch_requests(requests, 2)) == [
+            requests[0:2],
+            requests[2:4],
+            requests[4:5],
+        ]
+
+    def test_merged_first(self):
+        requests = [row_height_request(row, 30) for row in ("1", "2", "3")]
+        batches = list(batch_requests(requests, 2))
+        assert len(batches) == 1
+        assert batches[0] == merge_requests(requests)
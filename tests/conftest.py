@@ -10,6 +10,11 @@ import codepost
 import pytest
 
 from codepost_powertools.utils import cptypes
+from codepost_powertools.utils.codepost_utils import (
+    invalidate_assignment_cache,
+    invalidate_course_cache,
+    invalidate_roster_cache,
+)
 from tests.helpers import get_request_param, multi_scope_fixture
 from tests.mocks import MockAssignment, MockCourse, MockLogger, MockRoster
 
@@ -71,6 +76,17 @@ def fixture_track_no_error_logs(track_logs):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def fixture_invalidate_codepost_caches():
+    """Clears the caches of found courses, assignments, and rosters
+    before each test, since the courses are patched differently between
+    tests.
+    """
+    invalidate_course_cache()
+    invalidate_assignment_cache()
+    invalidate_roster_cache()
+
+
 @multi_scope_fixture(
     name="codepost_patch_courses",
     scopes=["function", "class"],
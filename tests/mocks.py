@@ -87,10 +87,13 @@ class MockAssignment:
         course_id=None,
         submissions=None,
         num_submissions=0,
+        rubric_categories=None,
     ):
+        # pylint: disable=invalid-name
         self.id = id_
         self.course = course_id
         self.name = name
+        self.rubricCategories = rubric_categories or []
         if submissions is not None:
             self._submissions = submissions
         else:
@@ -114,3 +117,39 @@ class MockSubmission:
         self.id = id_
         self.assignment = assignment_id
         self.students = students
+
+
+class MockRubricCategory:
+    """A mock of a codePost rubric category."""
+
+    def __init__(
+        self, id_=None, name=None, *, point_limit=None, comments=None
+    ):
+        self.id = id_
+        self.name = name
+        self.pointLimit = point_limit  # pylint: disable=invalid-name
+        self.rubricComments = comments or []  # pylint: disable=invalid-name
+
+
+class MockRubricComment:
+    """A mock of a codePost rubric comment."""
+
+    def __init__(
+        self,
+        id_=None,
+        name=None,
+        *,
+        text="",
+        point_delta=0,
+        explanation="",
+        instruction_text="",
+        template_text_on=False,
+    ):
+        # pylint: disable=invalid-name
+        self.id = id_
+        self.name = name
+        self.text = text
+        self.pointDelta = point_delta
+        self.explanation = explanation
+        self.instructionText = instruction_text
+        self.templateTextOn = template_text_on
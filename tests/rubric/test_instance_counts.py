@@ -0,0 +1,110 @@
+"""
+Tests the ``_instance_counts`` module.
+"""
+
+# =============================================================================
+
+import time
+
+import pytest
+
+from codepost_powertools.rubric import _instance_counts
+from codepost_powertools.rubric._instance_counts import (
+    InstanceCounts,
+    count_comment_instances,
+)
+from tests.mocks import MockAssignment
+
+# =============================================================================
+
+# maps: submission id -> (comment id, feedback) of each applied comment
+COMMENT_FEEDBACK = {
+    0: [(1, 0), (2, 1)],
+    1: [(1, 1), (1, -1), (3, 0)],
+    2: [],
+    3: [(2, -1), (2, 0), (1, 0)],
+    4: [(3, 1)],
+}
+
+# =============================================================================
+
+
+@pytest.fixture(name="mock_comment_feedback")
+def fixture_mock_comment_feedback(monkeypatch):
+    """Mocks getting the comment feedback of each submission.
+
+    Later submissions finish first, so that the results do not come
+    back in order. Submissions with negative ids fail.
+    """
+
+    def get_rubric_comment_feedback(submission):
+        if submission.id < 0:
+            raise RuntimeError("failed")
+        time.sleep(0.001 * (len(COMMENT_FEEDBACK) - submission.id))
+        return COMMENT_FEEDBACK[submission.id]
+
+    monkeypatch.setattr(
+        _instance_counts,
+        "_get_rubric_comment_feedback",
+        get_rubric_comment_feedback,
+    )
+
+
+def count_serially(comment_ids):
+    counts = {
+        comment_id: InstanceCounts(comment_id) for comment_id in comment_ids
+    }
+    for comment_feedback in COMMENT_FEEDBACK.values():
+        for comment_id, feedback in comment_feedback:
+            counts[comment_id].total += 1
+            if feedback == 1:
+                counts[comment_id].upvotes += 1
+            elif feedback == -1:
+                counts[comment_id].downvotes += 1
+    return counts
+
+
+# =============================================================================
+
+
+class TestInstanceCounts:
+    """Tests the class :class:`_instance_counts.InstanceCounts`."""
+
+    def test_eq(self):
+        assert InstanceCounts(1, 3, 2, 1) == InstanceCounts(1, 3, 2, 1)
+        assert InstanceCounts(1, 3, 2, 1) != InstanceCounts(1, 3, 1, 2)
+        assert InstanceCounts(1) != (1, 0, 0, 0)
+
+
+class TestCountCommentInstances:
+    """Tests the function :func:`_instance_counts.count_comment_instances`."""
+
+    def test_matches_serial(self, mock_comment_feedback):
+        assignment = MockAssignment(
+            1, "Assignment", num_submissions=len(COMMENT_FEEDBACK)
+        )
+        comment_ids = [1, 2, 3, 4]
+        counts = count_comment_instances(assignment, comment_ids)
+        assert counts == count_serially(comment_ids)
+        assert counts[1] == InstanceCounts(1, 4, 1, 1)
+        assert counts[4] == InstanceCounts(4)
+
+    def test_error_raised(self, mock_comment_feedback):
+        assignment = MockAssignment(1, "Assignment", num_submissions=3)
+        assignment.list_submissions()[1].id = -1
+        with pytest.raises(RuntimeError):
+            count_comment_instances(assignment, [1, 2, 3], log=False)
+
+    def test_error_logged(self, mock_comment_feedback, track_logs):
+        assignment = MockAssignment(
+            1, "Assignment", num_submissions=len(COMMENT_FEEDBACK)
+        )
+        # submission 1 fails, so its comments are not counted
+        assignment.list_submissions()[1].id = -1
+        track_logs.reset("ERROR")
+        counts = count_comment_instances(assignment, [1, 2, 3], log=True)
+        assert track_logs.saw_msg_logged(
+            "ERROR", r"Failed to get the comments of submission -1: failed"
+        )
+        assert counts[1] == InstanceCounts(1, 2, 0, 0)
+        assert counts[3] == InstanceCounts(3, 1, 1, 0)
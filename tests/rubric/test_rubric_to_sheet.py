@@ -0,0 +1,64 @@
+"""
+Tests the ``rubric_to_sheet`` module.
+"""
+
+# =============================================================================
+
+from codepost_powertools.rubric.rubric_to_sheet import (
+    Headers,
+    _get_codepost_rubric_as_data_rows,
+)
+from tests.mocks import MockAssignment, MockRubricCategory, MockRubricComment
+
+# =============================================================================
+
+
+class TestGetCodepostRubricAsDataRows:
+    """Tests the function
+    :func:`rubric_to_sheet._get_codepost_rubric_as_data_rows`.
+    """
+
+    def test_matches_headers(self):
+        assignment = MockAssignment(
+            1,
+            "Assignment",
+            rubric_categories=[
+                MockRubricCategory(
+                    2,
+                    "Category",
+                    point_limit=10,
+                    comments=[
+                        MockRubricComment(
+                            3,
+                            "tiered",
+                            text="\\[T2\\] caption",
+                            point_delta=3,
+                            explanation="explanation",
+                            instruction_text="instructions",
+                            template_text_on=True,
+                        ),
+                        MockRubricComment(4, "plain", text="no tier"),
+                    ],
+                ),
+                MockRubricCategory(5, "Unlimited"),
+            ],
+        )
+        rows = _get_codepost_rubric_as_data_rows(assignment)
+        assert list(rows) == [3, 4]
+        headers = Headers(False).names
+        for row in rows.values():
+            assert len(row) == len(headers)
+        assert dict(zip(headers, rows[3])) == {
+            "": 3,
+            "Category": "Category",
+            "Max": -10,
+            "Name": "tiered",
+            "Tier": 2,
+            "Points": -3,
+            "Grader Caption": "caption",
+            "Explanation": "explanation",
+            "Instructions": "instructions",
+            "Template?": "Yes",
+        }
+        assert dict(zip(headers, rows[4]))["Tier"] == ""
+        assert dict(zip(headers, rows[4]))["Grader Caption"] == "no tier"
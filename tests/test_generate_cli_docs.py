@@ -0,0 +1,78 @@
+"""
+Tests the docs helper that generates the CLI help docs.
+"""
+
+# =============================================================================
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# =============================================================================
+
+HELPER_PATH = (
+    Path(__file__).parents[1]
+    / "docs"
+    / "source"
+    / "_helpers"
+    / "generate_cli_docs.py"
+)
+
+# =============================================================================
+
+
+@pytest.fixture(name="generate_cli_docs")
+def fixture_generate_cli_docs(monkeypatch, tmp_path):
+    """Imports the docs helper and runs it in a temporary directory."""
+    spec = importlib.util.spec_from_file_location(
+        "generate_cli_docs", HELPER_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.chdir(tmp_path)
+    yield module
+
+
+class TestGenerate:
+    """Tests the function ``generate_cli_docs.generate()``."""
+
+    def test_ends_with_single_newline(self, generate_cli_docs):
+        help_text = generate_cli_docs.generate_cli_docs()
+        assert help_text.endswith("exit.\n")
+
+    def test_unchanged_not_rewritten(self, monkeypatch, generate_cli_docs):
+        num_generated = 0
+        generate_cli_docs_text = generate_cli_docs.generate_cli_docs
+
+        def count_generated():
+            nonlocal num_generated
+            num_generated += 1
+            return generate_cli_docs_text()
+
+        monkeypatch.setattr(
+            generate_cli_docs, "generate_cli_docs", count_generated
+        )
+
+        generate_cli_docs.generate()
+        help_file = Path("cli") / "cptools-cli-help-generated.rst"
+        contents = help_file.read_text(encoding="utf-8")
+        mtime = help_file.stat().st_mtime_ns
+        assert contents.startswith(generate_cli_docs.SIGNATURE_PREFIX)
+        assert num_generated == 1
+
+        generate_cli_docs.generate()
+        assert num_generated == 1
+        assert help_file.stat().st_mtime_ns == mtime
+        assert help_file.read_text(encoding="utf-8") == contents
+
+    def test_changed_signature_rewritten(self, monkeypatch, generate_cli_docs):
+        generate_cli_docs.generate()
+        help_file = Path("cli") / "cptools-cli-help-generated.rst"
+        monkeypatch.setattr(
+            generate_cli_docs, "source_signature", lambda: "changed"
+        )
+        generate_cli_docs.generate()
+        assert help_file.read_text(encoding="utf-8").startswith(
+            f"{generate_cli_docs.SIGNATURE_PREFIX}changed\n"
+        )
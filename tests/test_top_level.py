@@ -74,6 +74,18 @@ class TestLogInCodepost:
         assert track_logs.saw_level_logged("ERROR")
         assert track_logs.saw_msg_logged("ERROR", error_pattern)
 
+    def test_parent_not_directory(self, track_logs, tmp_path):
+        parent = tmp_path / "afile"
+        parent.write_text("")
+        config_file = parent / "config.yaml"
+        with pytest.raises(
+            FileNotFoundError, match=CONFIG_FILE_NOT_FOUND_ERROR
+        ):
+            cptools.log_in_codepost(config_file=config_file, log=False)
+        track_logs.reset("ERROR")
+        assert not cptools.log_in_codepost(config_file=config_file, log=True)
+        assert track_logs.saw_msg_logged("ERROR", CONFIG_FILE_NOT_FOUND_ERROR)
+
     @parametrize_indirect(
         {"tmp_file": ("config.yaml", "api_key: test_value")},
         {"tmp_file": ("config.yaml", "api_key: some random value")},
@@ -88,3 +100,30 @@ class TestLogInCodepost:
             )
             success = cptools.log_in_codepost(config_file=tmp_file, log=True)
             assert success
+
+    @parametrize_indirect({"tmp_file": ("config.yaml", "api_key: test_value")})
+    def test_cached(self, track_no_error_logs, tmp_file):
+        times_read = 0
+        read_config_file = codepost.read_config_file
+
+        def mock_read_config_file(*args, **kwargs):
+            nonlocal times_read
+            times_read += 1
+            return read_config_file(*args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                codepost.util.config,
+                "validate_api_key",
+                lambda *args, **kwargs: True,
+            )
+            monkeypatch.setattr(
+                codepost, "read_config_file", mock_read_config_file
+            )
+            assert cptools.log_in_codepost(config_file=tmp_file, log=True)
+            assert cptools.log_in_codepost(config_file=tmp_file, log=True)
+            assert times_read == 1
+            # changing the file should read it again
+            tmp_file.write_text("api_key: another_value")
+            assert cptools.log_in_codepost(config_file=tmp_file, log=True)
+            assert times_read == 2
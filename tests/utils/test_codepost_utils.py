@@ -19,11 +19,12 @@ decorators (which are applied when the file is loaded), so we must mock
 
 # =============================================================================
 
+import codepost
 import pytest
 
 from codepost_powertools.utils import codepost_utils as cp_utils
 from tests.helpers import parametrize, parametrize_indirect
-from tests.mocks import MockAssignment, MockCourse
+from tests.mocks import MockAssignment, MockCourse, MockRoster
 
 # =============================================================================
 
@@ -258,6 +259,72 @@ class TestGetCourse:
             "WARNING", MULTIPLE_COURSES_FOUND_WARNING
         )
 
+    def test_no_duplicate_check(
+        self, monkeypatch, track_logs, class_codepost_patch_courses
+    ):
+        num_searched = 0
+
+        def iter_available(*args, **kwargs):
+            nonlocal num_searched
+            for course in class_codepost_patch_courses:
+                num_searched += 1
+                yield course
+
+        monkeypatch.setattr(codepost.course, "iter_available", iter_available)
+
+        track_logs.reset("WARNING")
+        success, course = cp_utils.get_course(
+            "Course", "F2023", check_duplicates=False, log=True
+        )
+        assert success
+        assert_course(course, id_=2, name="Course", period="F2023")
+        # the search stops at the first match
+        assert num_searched == 2
+        assert not track_logs.saw_msg_logged(
+            "WARNING", MULTIPLE_COURSES_FOUND_WARNING
+        )
+
+    def test_cached(self, monkeypatch, class_codepost_patch_courses):
+        times_called = 0
+
+        def iter_available(*args, **kwargs):
+            nonlocal times_called
+            times_called += 1
+            return iter(class_codepost_patch_courses)
+
+        monkeypatch.setattr(codepost.course, "iter_available", iter_available)
+
+        for _ in range(2):
+            success, course = cp_utils.get_course("Course", "F2022")
+            assert success
+            assert_course(course, id_=1, name="Course", period="F2022")
+        assert times_called == 1
+
+        cp_utils.invalidate_course_cache()
+        success, course = cp_utils.get_course("Course", "F2022")
+        assert success
+        assert times_called == 2
+
+    def test_prefetch(self, monkeypatch, class_codepost_patch_courses):
+        times_called = 0
+
+        def iter_available(*args, **kwargs):
+            nonlocal times_called
+            times_called += 1
+            return iter(class_codepost_patch_courses)
+
+        monkeypatch.setattr(codepost.course, "iter_available", iter_available)
+
+        cp_utils.prefetch_courses()
+        assert times_called == 1
+        for period, expected_id in (("F2022", 1), ("F2023", 2), ("F2024", 4)):
+            success, course = cp_utils.get_course("Course", period)
+            assert success
+            assert_course(
+                course, id_=expected_id, name="Course", period=period
+            )
+        assert times_called == 1
+
 
 class TestWithCourse:
     """Tests the decorator.
@@ -349,6 +416,27 @@ class TestGetCourseRoster:
         assert roster is not None
         assert roster.id == course_obj.id
 
+    def test_cached(self, monkeypatch, mock_get_course_not_called):
+        times_called = 0
+
+        def retrieve(id_):
+            nonlocal times_called
+            times_called += 1
+            return MockRoster(id_)
+
+        monkeypatch.setattr(codepost.roster, "retrieve", retrieve)
+
+        course = MockCourse(1, "Course", "F2022")
+        _, roster = cp_utils.get_course_roster(course)
+        _, cached_roster = cp_utils.get_course_roster(course)
+        assert cached_roster is roster
+        assert times_called == 1
+
+        cp_utils.invalidate_roster_cache(course)
+        _, new_roster = cp_utils.get_course_roster(course)
+        assert new_roster is not roster
+        assert times_called == 2
+
 
 class TestGetAssignment:
     """Tests the function
@@ -520,6 +608,35 @@ class TestGetAssignment:
                 assignment, id_=expected_id, name=assignment_name
             )
 
+    def test_indexed(self, track_no_error_logs, mock_get_course_not_called):
+        course = MockCourse(
+            1,
+            "Course",
+            "F2022",
+            assignments=[MockAssignment(1, "Assignment1")],
+        )
+        success, _ = cp_utils.get_assignment(course, "Assignment1")
+        assert success
+        index = cp_utils.get_assignments_by_name(course)
+        assert list(index) == ["Assignment1"]
+        assert cp_utils.get_assignments_by_name(course) is index
+
+        # the assignments are indexed, so new assignments aren't seen
+        course.assignments.append(MockAssignment(2, "Assignment2"))
+        with pytest.raises(ValueError, match=ASSIGNMENT_NOT_FOUND_ERROR):
+            cp_utils.get_assignment(course, "Assignment2")
+
+        cp_utils.invalidate_assignment_cache(course)
+        success, assignment = cp_utils.get_assignment(course, "Assignment2")
+        assert success
+        assert_assignment(assignment, id_=2, name="Assignment2")
+
+        course.assignments.append(MockAssignment(3, "Assignment3"))
+        cp_utils.prefetch_assignments(course)
+        success, assignment = cp_utils.get_assignment(course, "Assignment3")
+        assert success
+        assert_assignment(assignment, id_=3, name="Assignment3")
+
 
 class TestWithCourseAndAssignment:
     # pylint: disable=line-too-long
@@ -0,0 +1,395 @@
+"""
+Tests the ``gspread`` wrapper helpers.
+"""
+
+# =============================================================================
+
+import gspread
+import pytest
+
+from codepost_powertools.utils.gspread_wrappers import Spreadsheet, Worksheet
+from tests.helpers import parametrize
+
+# =============================================================================
+
+
+def make_spreadsheet(**methods):
+    """Makes a spreadsheet that calls the given methods instead of
+    sending requests."""
+    spreadsheet = Spreadsheet.__new__(Spreadsheet)
+    spreadsheet.client = None
+    spreadsheet._properties = {"id": "spreadsheet", "title": "Spreadsheet"}
+    for name, method in methods.items():
+        setattr(spreadsheet, name, method)
+    return spreadsheet
+
+
+def make_gspread_worksheet(spreadsheet, title="Sheet", sheet_id=0, rows=1):
+    return gspread.Worksheet(
+        spreadsheet,
+        {
+            "sheetId": sheet_id,
+            "title": title,
+            "gridProperties": {"rowCount": rows},
+        },
+    )
+
+
+def make_worksheet(batch_update):
+    """Makes a worksheet whose spreadsheet calls ``batch_update`` instead
+    of sending requests."""
+    spreadsheet = make_spreadsheet(batch_update=batch_update)
+    return Worksheet(make_gspread_worksheet(spreadsheet))
+
+
+class TestSpreadsheetGetCellValues:
+    """Tests the method
+    :meth:`gspread_wrappers.Spreadsheet.get_cell_values`.
+    """
+
+    def test_empty(self):
+        def values_batch_get(ranges):
+            raise AssertionError("no request should be sent")
+
+        spreadsheet = make_spreadsheet(values_batch_get=values_batch_get)
+        assert spreadsheet.get_cell_values([]) == []
+
+    def test_order_and_padding(self):
+        requested = []
+
+        def values_batch_get(ranges):
+            requested.extend(ranges)
+            return {
+                "valueRanges": [
+                    {"range": ranges[0], "values": [["first"]]},
+                    # empty cells have no values
+                    {"range": ranges[1]},
+                    {"range": ranges[2], "values": [[]]},
+                    {"range": ranges[3], "values": [["last"]]},
+                ]
+            }
+
+        spreadsheet = make_spreadsheet(values_batch_get=values_batch_get)
+        worksheets = [
+            make_gspread_worksheet(spreadsheet, title, sheet_id)
+            for sheet_id, title in enumerate(("D", "C", "B", "A"))
+        ]
+        values = spreadsheet.get_cell_values(worksheets, "B2")
+        assert requested == ["'D'!B2", "'C'!B2", "'B'!B2", "'A'!B2"]
+        assert values == ["first", None, None, "last"]
+
+
+class TestSpreadsheetGetWorksheetsValues:
+    """Tests the method
+    :meth:`gspread_wrappers.Spreadsheet.get_worksheets_values`.
+    """
+
+    def test_empty(self):
+        def values_batch_get(ranges):
+            raise AssertionError("no request should be sent")
+
+        spreadsheet = make_spreadsheet(values_batch_get=values_batch_get)
+        assert spreadsheet.get_worksheets_values([]) == []
+
+    def test_order_and_padding(self):
+        requested = []
+
+        def values_batch_get(ranges):
+            requested.extend(ranges)
+            return {
+                "valueRanges": [
+                    {"range": ranges[0], "values": [["a"], ["b", "c"]]},
+                    # empty worksheets have no values
+                    {"range": ranges[1]},
+                    {"range": ranges[2], "values": [["d", "e"], [], ["f"]]},
+                ]
+            }
+
+        spreadsheet = make_spreadsheet(values_batch_get=values_batch_get)
+        worksheets = [
+            make_gspread_worksheet(spreadsheet, title, sheet_id)
+            for sheet_id, title in enumerate(("C", "B", "A"))
+        ]
+        # wrapped worksheets also work
+        worksheets[1] = Worksheet(worksheets[1])
+        values = spreadsheet.get_worksheets_values(worksheets)
+        assert requested == ["'C'", "'B'", "'A'"]
+        assert values == [
+            [["a", ""], ["b", "c"]],
+            [],
+            [["d", "e"], ["", ""], ["f", ""]],
+        ]
+
+
+def make_sheets_spreadsheet(titles):
+    """Makes a spreadsheet with worksheets with the given titles and
+    the ids 0 to n-1, which records the sent requests."""
+    sent = []
+
+    def batch_update(body):
+        sent.append(body["requests"])
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" not in request:
+                replies.append({})
+                continue
+            properties = dict(request["addSheet"]["properties"])
+            properties.setdefault("sheetId", 100 + len(replies))
+            replies.append({"addSheet": {"properties": properties}})
+        return {"replies": replies}
+
+    spreadsheet = make_spreadsheet(batch_update=batch_update)
+    existing = [
+        make_gspread_worksheet(spreadsheet, title, sheet_id)
+        for sheet_id, title in enumerate(titles)
+    ]
+    return spreadsheet, existing, sent
+
+
+def add_sheet_request(title, **properties):
+    return {
+        "addSheet": {
+            "properties": {
+                "title": title,
+                "sheetType": "GRID",
+                "gridProperties": {"rowCount": 1, "columnCount": 1},
+                **properties,
+            }
+        }
+    }
+
+
+class TestSpreadsheetAddWorksheets:
+    """Tests the method :meth:`gspread_wrappers.Spreadsheet.add_worksheets`."""
+
+    def test_titles(self):
+        spreadsheet, existing, sent = make_sheets_spreadsheet(["A", "A 1"])
+        fetched = []
+
+        def worksheets():
+            fetched.append(True)
+            return existing
+
+        spreadsheet.worksheets = worksheets
+        existing_titles = []
+        get_valid_worksheet_title = spreadsheet.get_valid_worksheet_title
+
+        def spy(title, **kwargs):
+            existing_titles.append(kwargs.get("existing_titles"))
+            return get_valid_worksheet_title(title, **kwargs)
+
+        spreadsheet.get_valid_worksheet_title = spy
+        added = spreadsheet.add_worksheets(["A", "A", "B"])
+        # the titles are de-duplicated against the existing titles and
+        # the earlier requested titles
+        assert [worksheet.title for worksheet in added] == ["A 2", "A 3", "B"]
+        assert sent == [
+            [
+                add_sheet_request("A 2"),
+                add_sheet_request("A 3"),
+                add_sheet_request("B"),
+            ]
+        ]
+        # the worksheets are only fetched once
+        assert len(fetched) == 1
+        assert len(existing_titles) == 3
+        assert None not in existing_titles
+
+
+class TestSpreadsheetRebuildWorksheets:
+    """Tests the method
+    :meth:`gspread_wrappers.Spreadsheet.rebuild_worksheets`.
+    """
+
+    def test_nothing(self):
+        spreadsheet, existing, sent = make_sheets_spreadsheet(["A"])
+        assert spreadsheet.rebuild_worksheets(existing) == ([], [])
+        assert sent == []
+
+    def test_add_only(self):
+        spreadsheet, existing, sent = make_sheets_spreadsheet(["A"])
+        replaced, added = spreadsheet.rebuild_worksheets(
+            existing, add=["A", "B"]
+        )
+        # no temporary worksheet is needed
+        assert sent == [[add_sheet_request("A 1"), add_sheet_request("B")]]
+        assert replaced == []
+        assert [worksheet.title for worksheet in added] == ["A 1", "B"]
+
+    def test_requests(self):
+        # the existing worksheets already use the ids 0, 1, and 2
+        spreadsheet, existing, sent = make_sheets_spreadsheet(["A", "B", "C"])
+        _, ws_b, ws_c = existing
+        replaced, added = spreadsheet.rebuild_worksheets(
+            existing, delete=[ws_b], replace=[(ws_c, 2)], add=["A", "B"]
+        )
+        assert sent == [
+            [
+                add_sheet_request("__temp", sheetId=3),
+                {"deleteSheet": {"sheetId": 1}},
+                {"deleteSheet": {"sheetId": 2}},
+                add_sheet_request("C", index=2),
+                # "A" still exists, but "B" was deleted
+                add_sheet_request("A 1"),
+                add_sheet_request("B"),
+                {"deleteSheet": {"sheetId": 3}},
+            ]
+        ]
+        assert [worksheet.title for worksheet in replaced] == ["C"]
+        assert [worksheet.title for worksheet in added] == ["A 1", "B"]
+
+    def test_temp_title(self):
+        spreadsheet, existing, sent = make_sheets_spreadsheet(["__temp"])
+        spreadsheet.rebuild_worksheets(existing, delete=existing)
+        assert sent == [
+            [
+                add_sheet_request("__temp 1", sheetId=1),
+                {"deleteSheet": {"sheetId": 0}},
+                {"deleteSheet": {"sheetId": 1}},
+            ]
+        ]
+
+
+class TestWorksheetUpdate:
+    """Tests the method :meth:`gspread_wrappers.Worksheet.update`."""
+
+    def test_chunks(self):
+        sent = []
+        worksheet = make_worksheet(lambda body: sent.append(body))
+        # rows with gaps between them, so none of the requests are merged
+        rows = list(range(1, 500, 2))
+        for row in rows:
+            worksheet.set_row_height(row, 30)
+        worksheet.update()
+        assert [len(body["requests"]) for body in sent] == [100, 100, 50]
+        sent_rows = [
+            request["updateDimensionProperties"]["range"]["startIndex"] + 1
+            for body in sent
+            for request in body["requests"]
+        ]
+        assert sent_rows == rows
+
+
+class TestWorksheetIterValues:
+    """Tests the method :meth:`gspread_wrappers.Worksheet.iter_values`."""
+
+    @staticmethod
+    def make_worksheet(values, rows):
+        """Makes a worksheet with the given number of rows whose range
+        requests return the given values."""
+        requested = []
+        spreadsheet = make_spreadsheet()
+        gspread_worksheet = make_gspread_worksheet(spreadsheet, rows=rows)
+
+        def get(range_a1):
+            requested.append(range_a1)
+            start, end = map(int, range_a1.split(":"))
+            return values[start - 1 : end]
+
+        gspread_worksheet.get = get
+        return Worksheet(gspread_worksheet), requested
+
+    def test_invalid_chunk_rows(self):
+        worksheet, _ = self.make_worksheet([], rows=1)
+        with pytest.raises(ValueError):
+            next(worksheet.iter_values(0))
+
+    def test_chunks(self):
+        values = [["1"], ["2", "b"], ["3"], ["4"], ["5", "e", "f"]]
+        worksheet, requested = self.make_worksheet(values, rows=5)
+        chunks = worksheet.iter_values(2)
+        # the chunks are only fetched when needed
+        assert requested == []
+        assert next(chunks) == [["1", ""], ["2", "b"]]
+        assert requested == ["1:2"]
+        assert list(chunks) == [[["3"], ["4"]], [["5", "e", "f"]]]
+        assert requested == ["1:2", "3:4", "5:5"]
+
+    def test_empty(self):
+        worksheet, requested = self.make_worksheet([], rows=3)
+        assert list(worksheet.iter_values(2)) == [[], []]
+        assert requested == ["1:2", "3:3"]
+
+
+class TestWorksheetFreeze:
+    """Tests the frozen counts of :class:`gspread_wrappers.Worksheet`."""
+
+    def test_sent(self):
+        worksheet = make_worksheet(lambda body: {})
+        worksheet.freeze(rows=1, cols=2)
+        assert worksheet.num_frozen_rows == 0
+        worksheet.update()
+        assert worksheet.num_frozen_rows == 1
+        assert worksheet.num_frozen_cols == 2
+
+    def test_failed(self):
+        def batch_update(body):
+            raise RuntimeError("failed")
+
+        worksheet = make_worksheet(batch_update)
+        with pytest.raises(RuntimeError):
+            worksheet.freeze(rows=1, update=True)
+        assert worksheet.num_frozen_rows == 0
+        # the failed freeze is not applied later either
+        worksheet._spreadsheet.batch_update = lambda body: {}
+        worksheet.update()
+        assert worksheet.num_frozen_rows == 0
+
+
+class TestWorksheetBatchUpdate:
+    """Tests the method :meth:`gspread_wrappers.Worksheet.batch_update`."""
+
+    def test_flush_once(self):
+        sent = []
+        worksheet = make_worksheet(lambda body: sent.append(body))
+        with worksheet.batch_update():
+            worksheet.freeze(rows=1, update=True)
+            with worksheet.batch_update():
+                worksheet.format_cell("A1", bold=True, update=True)
+                worksheet.update()
+            # the inner block does not flush
+            assert sent == []
+            worksheet.format_cell("B1", italic=True)
+        assert len(sent) == 1
+        assert len(sent[0]["requests"]) == 3
+        assert worksheet.num_frozen_rows == 1
+        # nothing is left to send after the block
+        worksheet.update()
+        assert len(sent) == 1
+
+    def test_exception(self):
+        sent = []
+        worksheet = make_worksheet(lambda body: sent.append(body))
+        with pytest.raises(RuntimeError):
+            with worksheet.batch_update():
+                worksheet.freeze(rows=1, cols=1, update=True)
+                raise RuntimeError("failed")
+        assert sent == []
+        assert worksheet.num_frozen_rows == 0
+        assert worksheet.num_frozen_cols == 0
+        # the requests stay cached until the next update
+        worksheet.update()
+        assert len(sent) == 1
+        assert worksheet.num_frozen_rows == 1
+
+
+class TestWorksheetMergeCells:
+    """Tests the method :meth:`gspread_wrappers.Worksheet.merge_cells`."""
+
+    @parametrize({"range_a1": "A1"}, {"range_a1": "B2:B2"})
+    def test_single_cell(self, range_a1):
+        worksheet = make_worksheet(lambda body: {})
+        worksheet.merge_cells(range_a1)
+        assert worksheet._pending_requests == []
+
+    @parametrize(
+        {"range_a1": "A1:B1"},
+        {"range_a1": "A1:A2"},
+        {"range_a1": "A:A"},
+        {"range_a1": "2"},
+    )
+    def test_multiple_cells(self, range_a1):
+        worksheet = make_worksheet(lambda body: {})
+        worksheet.merge_cells(range_a1)
+        assert len(worksheet._pending_requests) == 1
+        assert "mergeCells" in worksheet._pending_requests[0]